@@ -1,6 +1,6 @@
 __version__ = "0.8.1"
 
-from ._types import ExportType, RequestAction
+from ._types import CountStrategy, ExportFormat, ExportType, RequestAction
 from .actions import action
 from .base import BaseAdmin
 from .fields import (
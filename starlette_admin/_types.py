@@ -29,3 +29,41 @@ class ExportType(str, Enum):
     EXCEL = "excel"
     PDF = "pdf"
     PRINT = "print"
+
+
+class CountStrategy(str, Enum):
+    """Enumeration of string constants that represent how the total number of items
+    is computed for the List page.
+
+    Attributes:
+        EXACT: Count all matching items.
+        ESTIMATED: Use an approximate count from database statistics when the
+            backend supports it, otherwise fall back to the exact count.
+        CAPPED: Count matching items up to `count_cap + 1`, the List page then
+            displays `count_cap+` when there are more.
+        NONE: Don't count items, the List page only allows moving to the next
+            page while the current one is full.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CAPPED = "capped"
+    NONE = "none"
+
+
+class ExportFormat(str, Enum):
+    """Enumeration of string constants that represent the formats of server-side
+    exports, which are streamed by the server and include all matching items."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class Unset(Enum):
+    """Default value of the optional arguments defaulting to another argument,
+    when `None` has its own meaning."""
+
+    UNSET = "unset"
+
+
+UNSET = Unset.UNSET
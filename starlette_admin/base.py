@@ -1,16 +1,34 @@
+import csv
+import hashlib
+import io
 import json
 from json import JSONDecodeError
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
 
-from jinja2 import ChoiceLoader, FileSystemLoader, PackageLoader
+from jinja2 import BytecodeCache, ChoiceLoader, FileSystemLoader, PackageLoader
 from starlette.applications import Starlette
 from starlette.datastructures import FormData
 from starlette.exceptions import HTTPException
 from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, RedirectResponse, Response
+from starlette.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.routing import Mount, Route
-from starlette.staticfiles import StaticFiles
 from starlette.status import (
     HTTP_303_SEE_OTHER,
     HTTP_400_BAD_REQUEST,
@@ -20,8 +38,9 @@ from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 from starlette.templating import Jinja2Templates
-from starlette_admin._types import RequestAction
+from starlette_admin._types import ExportFormat, RequestAction
 from starlette_admin.auth import AuthMiddleware, AuthProvider
+from starlette_admin.encoders import JSONEncoder, get_json_encoder
 from starlette_admin.exceptions import ActionFailed, FormValidationError, LoginFailed
 from starlette_admin.helpers import get_file_icon
 from starlette_admin.i18n import (
@@ -33,6 +52,9 @@ from starlette_admin.i18n import (
     ngettext,
 )
 from starlette_admin.i18n import lazy_gettext as _
+from starlette_admin.responses import is_not_modified
+from starlette_admin.staticfiles import AdminStaticFiles, StaticFilesMount
+from starlette_admin.thumbnails import ThumbnailCache
 from starlette_admin.views import BaseModelView, BaseView, CustomView, DropDown, Link
 
 
@@ -53,6 +75,10 @@ class BaseAdmin:
         middlewares: Optional[Sequence[Middleware]] = None,
         debug: bool = False,
         i18n_config: Optional[I18nConfig] = None,
+        json_encoder: Optional[JSONEncoder] = None,
+        thumbnail_cache: Optional[ThumbnailCache] = None,
+        templates_bytecode_cache: Optional[BytecodeCache] = None,
+        precompile_templates: bool = False,
     ):
         """
         Parameters:
@@ -67,6 +93,17 @@ class BaseAdmin:
             auth_provider: Authentication Provider
             middlewares: Starlette middlewares
             i18n_config: i18n configuration
+            json_encoder: Callable used to encode API responses into JSON bytes.
+                Default to the fastest available encoder (orjson, msgspec or
+                the standard library), see `starlette_admin.encoders`.
+            thumbnail_cache: If set, images displayed in List pages without a
+                stored thumbnail are served as thumbnails generated and cached
+                by this [ThumbnailCache][starlette_admin.thumbnails.ThumbnailCache].
+            templates_bytecode_cache: Jinja2 bytecode cache storing the compiled
+                templates, e.g. `jinja2.FileSystemBytecodeCache()` to share them
+                between processes.
+            precompile_templates: Compile all the templates when the admin is
+                mounted instead of on their first use.
         """
         self.title = title
         self.base_url = base_url
@@ -87,6 +124,10 @@ class BaseAdmin:
         self.routes: List[Union[Route, Mount]] = []
         self.debug = debug
         self.i18n_config = i18n_config
+        self.json_encoder = json_encoder or get_json_encoder()
+        self.thumbnail_cache = thumbnail_cache
+        self.templates_bytecode_cache = templates_bytecode_cache
+        self.precompile_templates = precompile_templates
         self._setup_templates()
         self.init_locale()
         self.init_auth()
@@ -153,10 +194,12 @@ class BaseAdmin:
             )
 
     def init_routes(self) -> None:
-        statics = StaticFiles(directory=self.statics_dir, packages=["starlette_admin"])
+        statics = AdminStaticFiles(
+            directory=self.statics_dir, packages=["starlette_admin"]
+        )
         self.routes.extend(
             [
-                Mount("/statics", app=statics, name="statics"),
+                StaticFilesMount("/statics", app=statics, name="statics"),
                 Route(
                     self.index_view.path,
                     self._render_custom_view(self.index_view),
@@ -175,6 +218,12 @@ class BaseAdmin:
                     methods=["POST"],
                     name="action",
                 ),
+                Route(
+                    "/api/{identity}/export",
+                    self._export,
+                    methods=["GET"],
+                    name="export",
+                ),
                 Route(
                     "/{identity}/list",
                     self._render_list,
@@ -205,7 +254,11 @@ class BaseAdmin:
             self._views.append(self.index_view)
 
     def _setup_templates(self) -> None:
-        templates = Jinja2Templates(self.templates_dir, extensions=["jinja2.ext.i18n"])
+        templates = Jinja2Templates(
+            self.templates_dir,
+            extensions=["jinja2.ext.i18n"],
+            bytecode_cache=self.templates_bytecode_cache,
+        )
         templates.env.loader = ChoiceLoader(
             [
                 FileSystemLoader(self.templates_dir),
@@ -231,7 +284,9 @@ class BaseAdmin:
         templates.env.filters["get_admin_user"] = (
             self.auth_provider.get_admin_user if self.auth_provider else None
         )
-        templates.env.filters["tojson"] = lambda data: json.dumps(data, default=str)
+        templates.env.filters["tojson"] = lambda data: self.json_encoder(data).decode(
+            "utf-8"
+        )
         templates.env.filters["file_icon"] = get_file_icon
         templates.env.filters[
             "to_model"
@@ -244,6 +299,13 @@ class BaseAdmin:
         templates.env.install_gettext_callables(gettext, ngettext, True)  # type: ignore
         self.templates = templates
 
+    def compile_templates(self) -> None:
+        """Compile the package templates and those in `templates_dir`, filling
+        the Jinja2 template cache and bytecode cache."""
+        env = self.templates.env
+        for name in env.list_templates(extensions=["html"]):
+            env.get_template(name)
+
     def setup_view(self, view: BaseView) -> None:
         if isinstance(view, DropDown):
             for sub_view in view.views:
@@ -287,12 +349,54 @@ class BaseAdmin:
         model = self._find_model_from_identity(identity)
         if not model.is_accessible(request):
             return JSONResponse(None, status_code=HTTP_403_FORBIDDEN)
+        select2 = "select2" in request.query_params
+        request.state.action = RequestAction.API if select2 else RequestAction.LIST
+        etag = None
+        if model.api_etag:
+            version = await model.get_api_version(request)
+            if version is not None:
+                etag = _api_etag(request, version.encode())
+                if is_not_modified(request, etag):
+                    return Response(
+                        status_code=304, headers=_api_cache_headers(model, etag)
+                    )
+        body = await self._api_body(request, model, select2)
+        if model.api_etag and etag is None:
+            etag = _api_etag(request, body)
+            if is_not_modified(request, etag):
+                return Response(
+                    status_code=304, headers=_api_cache_headers(model, etag)
+                )
+        return Response(
+            body,
+            media_type="application/json",
+            headers=_api_cache_headers(model, etag),
+        )
+
+    async def _api_body(
+        self, request: Request, model: BaseModelView, select2: bool
+    ) -> bytes:
+        key = None if model.cache is None else await model.get_cache_key(request)
+        if key is None:
+            return self.json_encoder(await self._api_content(request, model, select2))
+        assert model.cache is not None
+        body = await model.cache.get(key)
+        if body is None:
+            body = self.json_encoder(await self._api_content(request, model, select2))
+            await model.cache.set(key, body, model.cache_ttl)
+        return body
+
+    async def _api_content(
+        self, request: Request, model: BaseModelView, select2: bool
+    ) -> Dict[str, Any]:
         skip = int(request.query_params.get("skip") or "0")
         limit = int(request.query_params.get("limit") or "100")
         order_by = request.query_params.getlist("order_by")
         where = request.query_params.get("where")
+        cursor = request.query_params.get("cursor")
         pks = request.query_params.getlist("pks")
-        select2 = "select2" in request.query_params
+        next_cursor = None
+        total: Optional[int] = None
         if len(pks) > 0:
             items = await model.find_by_pks(request, pks)
             total = len(items)
@@ -302,31 +406,114 @@ class BaseAdmin:
                     where = json.loads(where)
                 except JSONDecodeError:
                     where = str(where)
-            items = await model.find_all(
+            query: Union[Dict[str, Any], str, None] = where
+            if model.keyset_pagination:
+                order_by = model.get_keyset_order_by(order_by)
+                seek = (
+                    model.build_keyset_query(request, cursor, order_by, where)
+                    if cursor
+                    else None
+                )
+                if seek is not None:
+                    query, skip = seek, 0
+            items, total = await model.find_all_with_total(
                 request=request,
                 skip=skip,
                 limit=limit,
-                where=where,
+                where=query,
                 order_by=order_by,
+                total_where=where,
             )
-            total = await model.count(request=request, where=where)
-        return JSONResponse(
-            {
-                "items": [
-                    (
-                        await model.serialize(
-                            item,
-                            request,
-                            RequestAction.API if select2 else RequestAction.LIST,
-                            include_relationships=not select2,
-                            include_select2=select2,
+            if model.keyset_pagination:
+                items = list(items)
+                if 0 < limit <= len(items):
+                    next_cursor = model.get_next_cursor(items[-1], order_by)
+        content: Dict[str, Any] = {
+            "items": await model.serialize_many(
+                items,
+                request,
+                request.state.action,
+                include_relationships=not select2,
+                include_select2=select2,
+            ),
+            "total": total,
+        }
+        if model.keyset_pagination:
+            content["next_cursor"] = next_cursor
+        return content
+
+    async def _export(self, request: Request) -> Response:
+        identity = request.path_params.get("identity")
+        model = self._find_model_from_identity(identity)
+        if not model.is_accessible(request):
+            return JSONResponse(None, status_code=HTTP_403_FORBIDDEN)
+        export_format = request.query_params.get("format")
+        if export_format not in model.server_export_formats:
+            return JSONResponse(
+                {"msg": gettext("Unsupported export format")},
+                status_code=HTTP_400_BAD_REQUEST,
+            )
+        order_by = request.query_params.getlist("order_by")
+        where = request.query_params.get("where")
+        if where is not None:
+            try:
+                where = json.loads(where)
+            except JSONDecodeError:
+                where = str(where)
+        export_format = ExportFormat(export_format)
+        request.state.action = RequestAction.LIST
+        request.state.exporting = True
+        return StreamingResponse(
+            self._export_stream(request, model, export_format, where, order_by),
+            media_type=(
+                "text/csv"
+                if export_format == ExportFormat.CSV
+                else "application/x-ndjson"
+            ),
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="{model.identity}.{export_format.value}"'
+                )
+            },
+        )
+
+    async def _export_stream(
+        self,
+        request: Request,
+        model: BaseModelView,
+        export_format: ExportFormat,
+        where: Union[Dict[str, Any], str, None],
+        order_by: List[str],
+    ) -> AsyncIterator[bytes]:
+        columns = model._export_columns()
+        # The response is streamed after the request session is closed
+        async with model.concurrent_request(request) as export_request:
+            if export_format == ExportFormat.CSV:
+                yield _encode_csv([[label for _, label in columns]])
+            async for items in model.iter_all(
+                export_request, where, order_by, model.export_chunk_size
+            ):
+                rows = [
+                    [_lookup(obj, name) for name, _ in columns]
+                    for obj in await model.serialize_many(
+                        items, export_request, RequestAction.LIST
+                    )
+                ]
+                if export_format == ExportFormat.CSV:
+                    yield _encode_csv(
+                        [
+                            [_csv_value(value, self.json_encoder) for value in row]
+                            for row in rows
+                        ]
+                    )
+                else:
+                    yield b"".join(
+                        self.json_encoder(
+                            {name: value for (name, _), value in zip(columns, row)}
                         )
+                        + b"\n"
+                        for row in rows
                     )
-                    for item in items
-                ],
-                "total": total,
-            }
-        )
 
     async def handle_action(self, request: Request) -> Response:
         try:
@@ -337,7 +524,10 @@ class BaseAdmin:
             if not model.is_accessible(request):
                 raise ActionFailed("Forbidden")
             assert name is not None
-            msg = await model.handle_action(request, pks, name)
+            try:
+                msg = await model.handle_action(request, pks, name)
+            finally:
+                await model.invalidate_cache()
             return JSONResponse({"msg": msg})
         except ActionFailed as exc:
             return JSONResponse({"msg": exc.msg}, status_code=HTTP_400_BAD_REQUEST)
@@ -405,8 +595,9 @@ class BaseAdmin:
         model = self._find_model_from_identity(identity)
         if not model.is_accessible(request) or not model.can_view_details(request):
             raise HTTPException(HTTP_403_FORBIDDEN)
+        request.state.action = RequestAction.DETAIL
         pk = request.path_params.get("pk")
-        obj = await model.find_by_pk(request, pk)
+        obj = await model.get_by_pk(request, pk)
         if obj is None:
             raise HTTPException(HTTP_404_NOT_FOUND)
         return self.templates.TemplateResponse(
@@ -424,6 +615,7 @@ class BaseAdmin:
         model = self._find_model_from_identity(identity)
         if not model.is_accessible(request) or not model.can_create(request):
             raise HTTPException(HTTP_403_FORBIDDEN)
+        request.state.action = RequestAction.CREATE
         if request.method == "GET":
             return self.templates.TemplateResponse(
                 model.create_template,
@@ -433,6 +625,7 @@ class BaseAdmin:
         dict_obj = await self.form_to_dict(request, form, model, RequestAction.CREATE)
         try:
             obj = await model.create(request, dict_obj)
+            await model.invalidate_cache()
         except FormValidationError as exc:
             return self.templates.TemplateResponse(
                 model.create_template,
@@ -459,8 +652,9 @@ class BaseAdmin:
         model = self._find_model_from_identity(identity)
         if not model.is_accessible(request) or not model.can_edit(request):
             raise HTTPException(HTTP_403_FORBIDDEN)
+        request.state.action = RequestAction.EDIT
         pk = request.path_params.get("pk")
-        obj = await model.find_by_pk(request, pk)
+        obj = await model.get_by_pk(request, pk)
         if obj is None:
             raise HTTPException(HTTP_404_NOT_FOUND)
         if request.method == "GET":
@@ -477,6 +671,7 @@ class BaseAdmin:
         dict_obj = await self.form_to_dict(request, form, model, RequestAction.EDIT)
         try:
             obj = await model.edit(request, pk, dict_obj)
+            await model.invalidate_cache()
         except FormValidationError as exc:
             return self.templates.TemplateResponse(
                 model.edit_template,
@@ -527,6 +722,8 @@ class BaseAdmin:
         return data
 
     def mount_to(self, app: Starlette) -> None:
+        if self.precompile_templates:
+            self.compile_templates()
         admin_app = Starlette(
             routes=self.routes,
             middleware=self.middlewares,
@@ -534,8 +731,57 @@ class BaseAdmin:
             exception_handlers={HTTPException: self._render_error},
         )
         admin_app.state.ROUTE_NAME = self.route_name
+        admin_app.state.THUMBNAILS = self.thumbnail_cache is not None
+        admin_app.state.AUTH_PROVIDER = self.auth_provider
         app.mount(
             self.base_url,
             app=admin_app,
             name=self.route_name,
         )
+
+
+def _api_etag(request: Request, version: bytes) -> str:
+    """Hash `version` with what else the API response depends on: the query
+    and the locale."""
+    digest = hashlib.sha1(version)
+    digest.update(f"|{request.url.path}?{request.url.query}|{get_locale()}".encode())
+    return digest.hexdigest()
+
+
+def _api_cache_headers(model: BaseModelView, etag: Optional[str]) -> Dict[str, str]:
+    headers = {}
+    if etag is not None:
+        headers["ETag"] = f'W/"{etag}"'
+    if model.api_cache_max_age is not None:
+        headers["Cache-Control"] = f"private, max-age={model.api_cache_max_age}"
+    elif etag is not None:
+        headers["Cache-Control"] = "private, no-cache"
+    return headers
+
+
+def _lookup(obj: Dict[str, Any], name: str) -> Any:
+    """Return the value of a serialized field, `name` being dotted for fields
+    nested in a CollectionField."""
+    value: Any = obj
+    for part in name.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def _csv_value(value: Any, json_encoder: JSONEncoder) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        # Related items are represented by their `_repr`
+        if "_repr" in value:
+            return value["_repr"]
+        return json_encoder(value).decode("utf-8")
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(_csv_value(v, json_encoder)) for v in value)
+    return value
+
+
+def _encode_csv(rows: List[List[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
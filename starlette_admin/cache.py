@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Optional, Tuple
+
+
+class BaseCache(ABC):
+    """
+    Base class for the caches used by [BaseModelView][starlette_admin.views.BaseModelView]
+    to store the List page API responses. Override `get` and `set` to plug an
+    external store (Redis, Memcached, ...). Values are `bytes`.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the value stored for `key`, None when it is missing or expired."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` for `key`, for `ttl` seconds if it is not None."""
+        raise NotImplementedError()
+
+
+class MemoryCache(BaseCache):
+    """
+    In-process LRU cache.
+
+    Parameters:
+        max_entries: Maximum number of entries, the least recently used ones
+            are removed first.
+        ttl: Default lifetime of the entries in seconds, None to keep them
+            until they are removed by the LRU policy.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (None if ttl is None else monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,12 +1,23 @@
+from functools import partial
+from typing import Iterator
+
 import gridfs
 from bson import ObjectId
+from bson.errors import InvalidId
+from gridfs import GridOut
 from mongoengine.connection import get_db
 from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import Response, StreamingResponse
+from starlette.responses import Response
 from starlette.routing import Route
 from starlette_admin.base import BaseAdmin
+from starlette_admin.responses import (
+    file_response,
+    is_not_modified,
+    not_modified_response,
+)
 
 
 class Admin(BaseAdmin):
@@ -19,20 +30,67 @@ class Admin(BaseAdmin):
                 name="api:file",
             )
         )
+        if self.thumbnail_cache is not None:
+            self.routes.append(
+                Route(
+                    "/api/thumbnail/{db}/{col}/{pk}",
+                    self._serve_thumbnail,
+                    methods=["GET"],
+                    name="api:thumbnail",
+                )
+            )
         super().mount_to(app)
 
+    async def _serve_thumbnail(self, request: Request) -> Response:
+        assert self.thumbnail_cache is not None
+        db, col, pk = (request.path_params[name] for name in ("db", "col", "pk"))
+        fs = gridfs.GridFS(get_db(db), col)
+        try:
+            return await self.thumbnail_cache.response(
+                request,
+                f"{db}/{col}/{pk}",
+                lambda: fs.get(ObjectId(pk)).read(),
+                fallback=partial(_serve_file, request),
+            )
+        except (gridfs.NoFile, InvalidId):
+            raise HTTPException(404)  # noqa B904
+
 
-def _serve_file(request: Request) -> Response:
+async def _serve_file(request: Request) -> Response:
     pk = request.path_params.get("pk")
     col = request.path_params.get("col")
     db = request.path_params.get("db")
+    # A GridFS file is never updated in place, its _id identifies its content
+    if is_not_modified(request, pk):
+        return not_modified_response(pk)
     fs = gridfs.GridFS(get_db(db), col)  # type: ignore
     try:
-        file = fs.get(ObjectId(pk))
-        return StreamingResponse(
-            file,
-            media_type=file.content_type,
-            headers={"Content-Disposition": f"attachment;filename={file.filename}"},
-        )
+        file = await run_in_threadpool(fs.get, ObjectId(pk))
     except Exception:
         raise HTTPException(404)  # noqa B904
+    return file_response(
+        request,
+        partial(_iter_file, file),
+        size=file.length,
+        media_type=file.content_type or "application/octet-stream",
+        filename=file.filename or str(pk),
+        etag=pk,
+        last_modified=file.upload_date,
+    )
+
+
+def _iter_file(file: GridOut, start: int, end: int) -> Iterator[bytes]:
+    """Iterate over the bytes `start` to `end` (inclusive) of `file`, one GridFS
+    chunk at a time."""
+    try:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = file.readchunk()
+            if len(chunk) == 0:
+                break
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
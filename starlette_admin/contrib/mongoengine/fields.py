@@ -21,26 +21,36 @@ class ImageField(BaseImageField):
     async def serialize_value(
         self, request: Request, value: Any, action: RequestAction
     ) -> Any:
-        return _serialize_file_field(request, value, action)
+        return _serialize_file_field(request, value, action, thumbnail=True)
 
 
 def _serialize_file_field(
-    request: Request, value: GridFSProxy, action: RequestAction
+    request: Request,
+    value: GridFSProxy,
+    action: RequestAction,
+    thumbnail: bool = False,
 ) -> Optional[Dict[str, str]]:
     if value.grid_id:
-        id = value.grid_id
+        id, route = value.grid_id, "api:file"
         if (
             action == RequestAction.LIST
             and getattr(value, "thumbnail_id", None) is not None
         ):
             """Use thumbnail on list page if available"""
             id = value.thumbnail_id
+        elif (
+            action == RequestAction.LIST
+            and thumbnail
+            and getattr(request.app.state, "THUMBNAILS", False)
+        ):
+            """Otherwise, use the thumbnails generated by the admin"""
+            route = "api:thumbnail"
         return {
             "filename": getattr(value, "filename", "unamed"),
             "content_type": getattr(value, "content_type", "application/octet-stream"),
             "url": str(
                 request.url_for(
-                    request.app.state.ROUTE_NAME + ":api:file",
+                    request.app.state.ROUTE_NAME + ":" + route,
                     db=value.db_alias,
                     col=value.collection_name,
                     pk=id,
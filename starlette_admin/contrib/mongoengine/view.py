@@ -1,16 +1,31 @@
 import functools
-from typing import Any, Dict, List, Optional, Sequence, Type, Union
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+import anyio.to_thread
 import mongoengine as me
 import starlette_admin.fields as sa
-from bson import ObjectId
+from bson import DBRef, ObjectId
 from mongoengine.base import BaseDocument
 from mongoengine.base.fields import BaseField as MongoBaseField
 from mongoengine.errors import DoesNotExist, ValidationError
 from mongoengine.fields import GridFSProxy
-from mongoengine.queryset import QNode
+from mongoengine.queryset import QNode, QuerySet
 from starlette.datastructures import UploadFile
 from starlette.requests import Request
+from starlette_admin._types import UNSET, CountStrategy, RequestAction, Unset
 from starlette_admin.contrib.mongoengine.fields import FileField, ImageField
 from starlette_admin.contrib.mongoengine.helpers import (
     Q,
@@ -23,8 +38,38 @@ from starlette_admin.exceptions import FormValidationError
 from starlette_admin.helpers import prettify_class_name, slugify_class_name
 from starlette_admin.views import BaseModelView
 
+T = TypeVar("T")
+
 
 class ModelView(BaseModelView):
+    """
+    Attributes:
+        run_in_thread: Run the blocking pymongo calls in worker threads instead of
+            the event loop. Default value is `True`.
+        thread_limit: Maximum number of worker threads running the pymongo calls of
+            this view at the same time. By default, the anyio default thread limiter
+            is used, which is shared by the whole application.
+        batch_size: Number of documents returned by each batch of the cursor when all
+            the items are requested. Pages are always fetched in a single batch.
+        list_as_pymongo: Build the List page items from the raw pymongo documents
+            (`as_pymongo()`) instead of instantiating the Document class. Only used
+            when the List page doesn't display relations or files and the object
+            representation is not customized.
+        facet_count: Fetch the List page and the total number of items with a single
+            `$facet` aggregation instead of two queries. Only used with
+            `CountStrategy.EXACT`. The page is returned within a single document,
+            which must not exceed the 16MB BSON limit. The items are sorted before
+            `$facet`, without a `$limit` next to `$sort`: only enable it when the
+            List page is sorted by indexed fields, otherwise every page sorts all
+            the matching documents in memory.
+    """
+
+    run_in_thread: bool = True
+    thread_limit: Optional[int] = None
+    batch_size: Optional[int] = None
+    list_as_pymongo: bool = False
+    facet_count: bool = False
+
     def __init__(
         self,
         document: Type[me.Document],
@@ -43,6 +88,7 @@ class ModelView(BaseModelView):
         self.name = name or self.name or prettify_class_name(self.document.__name__)
         self.icon = icon
         self.pk_attr = "id"
+        self._limiter: Optional[anyio.CapacityLimiter] = None
         if self.fields is None or len(self.fields) == 0:
             self.fields = document._fields_ordered
         converted_fields = []
@@ -62,6 +108,7 @@ class ModelView(BaseModelView):
         self.exclude_fields_from_detail = normalize_list(self.exclude_fields_from_detail)  # type: ignore
         self.exclude_fields_from_create = normalize_list(self.exclude_fields_from_create)  # type: ignore
         self.exclude_fields_from_edit = normalize_list(self.exclude_fields_from_edit)  # type: ignore
+        self.always_loaded_fields = normalize_list(self.always_loaded_fields)
         self.searchable_fields = normalize_list(self.searchable_fields)
         self.sortable_fields = normalize_list(self.sortable_fields)
         self.export_fields = normalize_list(self.export_fields)
@@ -76,7 +123,35 @@ class ModelView(BaseModelView):
         where: Union[Dict[str, Any], str, None] = None,
     ) -> int:
         q = await self._build_query(request, where)
-        return self.document.objects(q).count()
+        return await self._run_sync(self.document.objects(q).count)
+
+    async def estimated_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+    ) -> int:
+        """
+        Return the collection metadata count (`estimated_document_count`) when
+        there is no filter, otherwise the exact count.
+        """
+        if not where:
+            return await self._run_sync(
+                lambda: self.document._get_collection().estimated_document_count()
+            )
+        return await self.count(request, where)
+
+    async def capped_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+        cap: int = 10000,
+    ) -> int:
+        q = await self._build_query(request, where)
+        return await self._run_sync(
+            functools.partial(
+                self.document.objects(q).limit(cap + 1).count, with_limit_and_skip=True
+            )
+        )
 
     async def find_all(
         self,
@@ -86,33 +161,96 @@ class ModelView(BaseModelView):
         where: Union[Dict[str, Any], str, None] = None,
         order_by: Optional[List[str]] = None,
     ) -> Sequence[Any]:
-        q = await self._build_query(request, where)
-        objs = self.document.objects(q).order_by(*build_order_clauses(order_by or []))
+        objs, names = await self._get_queryset(request, where, order_by)
+        objs = objs[skip : skip + limit] if limit > 0 else objs[skip:]
+        batch_size = limit if limit > 0 else self.batch_size
+        if batch_size is not None:
+            objs = objs.batch_size(batch_size)
+        objs = objs.no_cache()
+        if names is not None and self._can_use_pymongo(request):
+            rows: List[Dict[str, Any]] = await self._run_sync(list, objs.as_pymongo())
+            return [self._from_pymongo(row, names) for row in rows]
+        return await self._prefetch_references(
+            request, await self._run_sync(list, objs)
+        )
+
+    async def find_all_with_total(
+        self,
+        request: Request,
+        skip: int = 0,
+        limit: int = 100,
+        where: Union[Dict[str, Any], str, None] = None,
+        order_by: Optional[List[str]] = None,
+        total_where: Union[Dict[str, Any], str, None, Unset] = UNSET,
+    ) -> Tuple[Sequence[Any], Optional[int]]:
+        if isinstance(total_where, Unset):
+            total_where = where
+        if (
+            not self.facet_count
+            or self.count_strategy != CountStrategy.EXACT
+            or where != total_where
+        ):
+            return await super().find_all_with_total(
+                request, skip, limit, where, order_by, total_where
+            )
+        objs, names = await self._get_queryset(request, where, order_by)
+        items_pipeline: List[Dict[str, Any]] = [{"$skip": skip}]
         if limit > 0:
-            return objs[skip : skip + limit]
-        return objs[skip:]
+            items_pipeline.append({"$limit": limit})
+        if names is not None:
+            items_pipeline.append(
+                {
+                    "$project": {
+                        self.document._fields[name].db_field: 1
+                        for name in names
+                        if name in self.document._fields
+                    }
+                }
+            )
+        pipeline = [
+            {"$facet": {"items": items_pipeline, "total": [{"$count": "count"}]}}
+        ]
+        result = await self._run_sync(lambda: next(objs.aggregate(pipeline)))
+        total = result["total"][0]["count"] if len(result["total"]) > 0 else 0
+        if names is not None and self._can_use_pymongo(request):
+            return [self._from_pymongo(row, names) for row in result["items"]], total
+        items = [self.document._from_son(doc) for doc in result["items"]]
+        return await self._prefetch_references(request, items), total
+
+    def coerce_pk(self, pk: Any) -> Any:
+        return self.document._fields[self.document._meta["id_field"]].to_python(pk)
 
     async def find_by_pk(self, request: Request, pk: Any) -> Optional[me.Document]:
+        objs = self.document.objects(id=pk)
+        names = self._projected_fields(request, self.document)
+        if names is not None:
+            objs = objs.only(*names)
         try:
-            return self.document.objects(id=pk).get()
+            obj = await self._run_sync(objs.get)
         except (DoesNotExist, ValidationError):
             return None
+        return (await self._prefetch_references(request, [obj]))[0]
 
     async def find_by_pks(
         self, request: Request, pks: List[Any]
     ) -> Sequence[me.Document]:
-        return self.document.objects(id__in=pks)
+        objs = self.document.objects(id__in=pks).batch_size(len(pks)).no_cache()
+        return await self._prefetch_references(
+            request, await self._run_sync(list, objs)
+        )
 
     async def create(self, request: Request, data: Dict[str, Any]) -> None:
         try:
-            return (await self._populate_obj(request, self.document(), data)).save()
+            obj = await self._populate_obj(request, self.document(), data)
+            return await self._run_sync(obj.save)
         except Exception as e:
             self.handle_exception(e)
 
     async def edit(self, request: Request, pk: Any, data: Dict[str, Any]) -> Any:
         try:
-            obj = await self.find_by_pk(request, pk)
-            return (await self._populate_obj(request, obj, data, True)).save()
+            obj = await self.get_by_pk(request, pk)
+            obj = await self._populate_obj(request, obj, data, True)
+            return await self._run_sync(obj.save)
         except Exception as e:
             self.handle_exception(e)
 
@@ -140,20 +278,16 @@ class ModelView(BaseModelView):
                 proxy: GridFSProxy = getattr(obj, name)
                 value, should_be_deleted = value
                 if should_be_deleted:
-                    proxy.delete()
+                    await self._run_sync(proxy.delete)
                 elif isinstance(value, UploadFile):
-                    if proxy.grid_id is not None:
-                        proxy.replace(
-                            value.file,
-                            filename=value.filename,
-                            content_type=value.content_type,
-                        )
-                    else:
-                        proxy.put(
+                    await self._run_sync(
+                        functools.partial(
+                            proxy.replace if proxy.grid_id is not None else proxy.put,
                             value.file,
                             filename=value.filename,
                             content_type=value.content_type,
                         )
+                    )
 
             elif isinstance(me_field, me.EmbeddedDocumentField) and value is not None:
                 assert isinstance(field, sa.CollectionField)
@@ -212,7 +346,110 @@ class ModelView(BaseModelView):
         return obj
 
     async def delete(self, request: Request, pks: List[Any]) -> Optional[int]:
-        return self.document.objects(id__in=pks).delete()
+        return await self._run_sync(self.document.objects(id__in=pks).delete)
+
+    async def _prefetch_references(
+        self, request: Request, objs: List[me.Document]
+    ) -> List[me.Document]:
+        """Dereference the `ReferenceField` values of the relation fields displayed
+        by the action the request is processed for, fetching each referenced
+        collection once with `$in` instead of once per value."""
+        references = self._get_references(request)
+        ids: Dict[Type[me.Document], Set[Any]] = {}
+        for name, many, document_type in references:
+            for obj in objs:
+                value = obj._data.get(name)
+                for v in (value or []) if many else [value]:
+                    ref_id = _reference_id(v)
+                    if ref_id is not None:
+                        ids.setdefault(document_type, set()).add(ref_id)
+        fetched: Dict[Type[me.Document], Dict[Any, me.Document]] = {}
+        for document_type, pks in ids.items():
+            docs: List[me.Document] = await self._run_sync(
+                list, document_type.objects(pk__in=list(pks))
+            )
+            fetched[document_type] = {doc.pk: doc for doc in docs}
+        for name, many, document_type in references:
+            docs_by_id = fetched.get(document_type, {})
+            for obj in objs:
+                value = obj._data.get(name)
+                if many and value:
+                    obj._data[name] = [
+                        docs_by_id.get(_reference_id(v), v) for v in value
+                    ]
+                elif not many and value is not None:
+                    obj._data[name] = docs_by_id.get(_reference_id(value), value)
+        return objs
+
+    def _get_references(
+        self, request: Request
+    ) -> List[Tuple[str, bool, Type[me.Document]]]:
+        """Return the name, whether it is a list and the referenced document of
+        the `ReferenceField` behind each relation field serialized by the action
+        the request is processed for. Relations are not serialized by select2
+        requests nor custom actions, their references are dereferenced lazily."""
+        action = getattr(request.state, "action", None)
+        if action not in (RequestAction.LIST, RequestAction.DETAIL, RequestAction.EDIT):
+            return []
+        hidden_relations = self._hidden_relations(request, action)
+        references = []
+        for field in self.fields:
+            if isinstance(field, sa.RelationField):
+                me_field = self.document._fields.get(field.name)
+                many = isinstance(me_field, me.ListField)
+                ref_field = me_field.field if many else me_field
+                if field.name not in hidden_relations and isinstance(
+                    ref_field, me.ReferenceField
+                ):
+                    references.append((field.name, many, ref_field.document_type))
+        return references
+
+    async def _get_queryset(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+        order_by: Optional[List[str]] = None,
+    ) -> Tuple[QuerySet, Optional[Set[str]]]:
+        """Return the filtered and ordered queryset of the List page and the names
+        of the projected fields (`None` when all the fields are loaded)."""
+        q = await self._build_query(request, where)
+        objs = self.document.objects(q).order_by(*build_order_clauses(order_by or []))
+        names = self._projected_fields(request, self.document)
+        if names is not None:
+            names.update(value.strip().split(maxsplit=1)[0] for value in order_by or [])
+            objs = objs.only(*names)
+        return objs, names
+
+    def _can_use_pymongo(self, request: Request) -> bool:
+        return (
+            self.list_as_pymongo
+            and getattr(request.state, "action", None) == RequestAction.LIST
+            and not hasattr(self.document, "__admin_repr__")
+            and type(self).repr is BaseModelView.repr
+            and not any(
+                isinstance(field, (sa.RelationField, sa.FileField))
+                for field in self._action_fields(request, RequestAction.LIST)
+            )
+        )
+
+    def _from_pymongo(self, row: Dict[str, Any], names: Set[str]) -> SimpleNamespace:
+        """Convert the projected fields of a raw pymongo document to their python
+        value, without instantiating the Document class."""
+        values = {}
+        for name in names:
+            field = self.document._fields.get(name)
+            if field is not None:
+                value = row.get(field.db_field)
+                values[name] = None if value is None else field.to_python(value)
+        return SimpleNamespace(**values)
+
+    async def _run_sync(self, func: Callable[..., T], *args: Any) -> T:
+        """Call `func` in a worker thread, unless `run_in_thread` is disabled."""
+        if not self.run_in_thread:
+            return func(*args)
+        if self.thread_limit is not None and self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.thread_limit)
+        return await anyio.to_thread.run_sync(func, *args, limiter=self._limiter)
 
     def handle_exception(self, exc: Exception) -> None:
         if isinstance(exc, ValidationError):
@@ -248,3 +485,11 @@ class ModelView(BaseModelView):
         return (
             functools.reduce(lambda q1, q2: q1 | q2, queries) if queries else Q.empty()
         )
+
+
+def _reference_id(value: Any) -> Any:
+    """Return the id referenced by a raw `ReferenceField` value, or `None` when
+    the value is already dereferenced."""
+    if value is None or isinstance(value, BaseDocument):
+        return None
+    return value.id if isinstance(value, DBRef) else value
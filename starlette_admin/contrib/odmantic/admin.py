@@ -1,10 +1,12 @@
 from typing import Optional, Sequence, Union
 
+from jinja2 import BytecodeCache
 from odmantic import AIOEngine, SyncEngine
 from starlette.middleware import Middleware
 from starlette_admin.auth import AuthProvider
 from starlette_admin.base import BaseAdmin
 from starlette_admin.contrib.odmantic.middleware import EngineMiddleware
+from starlette_admin.encoders import JSONEncoder
 from starlette_admin.i18n import I18nConfig
 from starlette_admin.i18n import lazy_gettext as _
 from starlette_admin.views import CustomView
@@ -26,6 +28,9 @@ class Admin(BaseAdmin):
         middlewares: Optional[Sequence[Middleware]] = None,
         debug: bool = False,
         i18n_config: Optional[I18nConfig] = None,
+        json_encoder: Optional[JSONEncoder] = None,
+        templates_bytecode_cache: Optional[BytecodeCache] = None,
+        precompile_templates: bool = False,
     ) -> None:
         super().__init__(
             title=title,
@@ -40,6 +45,9 @@ class Admin(BaseAdmin):
             middlewares=middlewares,
             debug=debug,
             i18n_config=i18n_config,
+            json_encoder=json_encoder,
+            templates_bytecode_cache=templates_bytecode_cache,
+            precompile_templates=precompile_templates,
         )
         self.middlewares = [] if self.middlewares is None else list(self.middlewares)
         self.middlewares.insert(0, Middleware(EngineMiddleware, engine=engine))
@@ -231,3 +231,51 @@ def resolve_deep_query(
     if len(_all_queries) == 1:
         return _all_queries[0]
     return query.and_(*_all_queries) if _all_queries else QueryExpression({})
+
+
+def build_sort_stage(
+    model: t.Type[Model], order_list: t.List[str]
+) -> t.Dict[str, t.Any]:
+    """Return the `$sort` specification of the order clauses, keyed by the
+    names of the fields in the database."""
+    sort: t.Dict[str, t.Any] = {}
+    for value in order_list:
+        key, order = value.strip().split(maxsplit=1)
+        proxy = resolve_proxy(model, key)
+        if proxy is not None:
+            sort[+proxy] = -1 if order.lower() == "desc" else 1
+    return sort
+
+
+def build_references_lookup(model: t.Type[Model]) -> t.List[t.Dict[str, t.Any]]:
+    """Return the aggregation stages embedding the documents referenced by
+    `model`, recursively, as expected by `Model.parse_doc`."""
+    pipeline: t.List[t.Dict[str, t.Any]] = []
+    for field in model.__odm_fields__.values():
+        if isinstance(field, ODMReference):
+            pipeline.extend(
+                [
+                    {
+                        "$lookup": {
+                            "from": field.model.__collection__,
+                            "let": {"foreign_id": f"${field.key_name}"},
+                            "pipeline": [
+                                {
+                                    "$match": {
+                                        "$expr": {"$eq": ["$_id", "$$foreign_id"]}
+                                    }
+                                },
+                                *build_references_lookup(field.model),
+                            ],
+                            "as": field.key_name,
+                        }
+                    },
+                    {
+                        "$unwind": {
+                            "path": f"${field.key_name}",
+                            "preserveNullAndEmptyArrays": True,
+                        }
+                    },
+                ]
+            )
+    return pipeline
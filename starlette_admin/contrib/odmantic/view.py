@@ -1,6 +1,17 @@
 import re
+from contextlib import asynccontextmanager
 from functools import partial
-from typing import Any, Dict, List, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import anyio
 from bson import ObjectId
@@ -10,7 +21,10 @@ from odmantic.query import QueryExpression
 from odmantic.session import AIOSession, SyncSession
 from pydantic import ValidationError
 from starlette.requests import Request
+from starlette_admin._types import UNSET, CountStrategy, Unset
 from starlette_admin.contrib.odmantic.helpers import (
+    build_references_lookup,
+    build_sort_stage,
     convert_odm_field_to_admin_field,
     normalize_list,
     resolve_deep_query,
@@ -25,6 +39,7 @@ from starlette_admin.fields import (
     HasOne,
     ListField,
     PhoneField,
+    RelationField,
     StringField,
     TextAreaField,
     URLField,
@@ -38,6 +53,19 @@ from starlette_admin.views import BaseModelView
 
 
 class ModelView(BaseModelView):
+    """
+    Attributes:
+        facet_count: Fetch the List page and the total number of items with a single
+            `$facet` aggregation instead of two queries. Only used with
+            `CountStrategy.EXACT`. The page is returned within a single document,
+            which must not exceed the 16MB BSON limit. The items are sorted before
+            `$facet`, without a `$limit` next to `$sort`: only enable it when the
+            List page is sorted by indexed fields, otherwise every page sorts all
+            the matching documents in memory.
+    """
+
+    facet_count: bool = False
+
     def __init__(
         self,
         model: Type[Model],
@@ -92,6 +120,22 @@ class ModelView(BaseModelView):
         )
         super().__init__()
 
+    @asynccontextmanager
+    async def concurrent_session(
+        self, request: Request
+    ) -> AsyncIterator[Union[AIOSession, SyncSession]]:
+        """
+        Yield a new session from the same engine, as a client session can't be
+        used concurrently.
+        """
+        session: Union[AIOSession, SyncSession] = request.state.session
+        if isinstance(session, AIOSession):
+            async with session.engine.session() as concurrent_session:
+                yield concurrent_session
+        else:
+            with session.engine.session() as sync_session:
+                yield sync_session
+
     async def find_all(
         self,
         request: Request,
@@ -122,6 +166,57 @@ class ModelView(BaseModelView):
             )
         )
 
+    async def find_all_with_total(
+        self,
+        request: Request,
+        skip: int = 0,
+        limit: int = 100,
+        where: Union[Dict[str, Any], str, None] = None,
+        order_by: Optional[List[str]] = None,
+        total_where: Union[Dict[str, Any], str, None, Unset] = UNSET,
+    ) -> Tuple[Sequence[Any], Optional[int]]:
+        if isinstance(total_where, Unset):
+            total_where = where
+        if (
+            not self.facet_count
+            or self.count_strategy != CountStrategy.EXACT
+            or where != total_where
+        ):
+            return await super().find_all_with_total(
+                request, skip, limit, where, order_by, total_where
+            )
+        session: Union[AIOSession, SyncSession] = request.state.session
+        q = await self._build_query(request, where)
+        items_pipeline: List[Dict[str, Any]] = [{"$skip": skip}]
+        if limit > 0:
+            items_pipeline.append({"$limit": limit})
+        items_pipeline.extend(build_references_lookup(self.model))
+        pipeline: List[Dict[str, Any]] = [{"$match": q}]
+        sort = build_sort_stage(self.model, order_by or [])
+        if len(sort) > 0:
+            # Before $facet, where the sort can use an index
+            pipeline.append({"$sort": sort})
+        pipeline.append(
+            {"$facet": {"items": items_pipeline, "total": [{"$count": "count"}]}}
+        )
+        if isinstance(session, AIOSession):
+            result = (
+                await session.engine.get_collection(self.model)
+                .aggregate(pipeline, session=session.get_driver_session())
+                .to_list(length=1)
+            )[0]
+        else:
+            cursor = await anyio.to_thread.run_sync(
+                partial(
+                    session.engine.get_collection(self.model).aggregate,
+                    pipeline,
+                    session=session.get_driver_session(),
+                )
+            )
+            result = next(cursor)  # The single document is in the first batch
+        total = result["total"][0]["count"] if len(result["total"]) > 0 else 0
+        return [self.model.parse_doc(doc) for doc in result["items"]], total
+
     async def count(
         self, request: Request, where: Union[Dict[str, Any], str, None] = None
     ) -> int:
@@ -131,6 +226,49 @@ class ModelView(BaseModelView):
             return await session.count(self.model, q)
         return await anyio.to_thread.run_sync(session.count, self.model, q)
 
+    async def estimated_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+    ) -> int:
+        """
+        Return the collection metadata count (`estimated_document_count`) when
+        there is no filter, otherwise the exact count.
+        """
+        if where:
+            return await self.count(request, where)
+        session: Union[AIOSession, SyncSession] = request.state.session
+        if isinstance(session, AIOSession):
+            collection = session.engine.get_collection(self.model)
+            return await collection.estimated_document_count()
+        return await anyio.to_thread.run_sync(
+            session.engine.get_collection(self.model).estimated_document_count
+        )
+
+    async def capped_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+        cap: int = 10000,
+    ) -> int:
+        session: Union[AIOSession, SyncSession] = request.state.session
+        q = await self._build_query(request, where)
+        if isinstance(session, AIOSession):
+            return await session.engine.get_collection(self.model).count_documents(
+                q, limit=cap + 1, session=session.get_driver_session()
+            )
+        return await anyio.to_thread.run_sync(
+            partial(
+                session.engine.get_collection(self.model).count_documents,
+                q,
+                limit=cap + 1,
+                session=session.get_driver_session(),
+            )
+        )
+
+    def coerce_pk(self, pk: Any) -> Any:
+        return ObjectId(pk)
+
     async def find_by_pk(self, request: Request, pk: Any) -> Any:
         session: Union[AIOSession, SyncSession] = request.state.session
         if isinstance(session, AIOSession):
@@ -160,7 +298,7 @@ class ModelView(BaseModelView):
         session: Union[AIOSession, SyncSession] = request.state.session
         data = await self._arrange_data(request, data, is_edit=True)
         try:
-            instance = await self.find_by_pk(request, pk)
+            instance = await self.get_by_pk(request, pk)
             instance.update(data)
             if isinstance(session, AIOSession):
                 return await session.save(instance)
@@ -188,6 +326,7 @@ class ModelView(BaseModelView):
         fields: Optional[Sequence[BaseField]] = None,
     ) -> Dict[str, Any]:
         arranged_data: Dict[str, Any] = {}
+        relations: List[Tuple[RelationField, Any]] = []
         if fields is None:
             fields = self.fields
         for field in fields:
@@ -210,8 +349,8 @@ class ModelView(BaseModelView):
                     for v in value
                 ]
             elif isinstance(field, HasOne) and value is not None:
-                foreign_model = self._find_foreign_model(field.identity)  # type: ignore
-                arranged_data[name] = await foreign_model.find_by_pk(request, value)
+                arranged_data[name] = value
+                relations.append((field, value))
             elif isinstance(field, HasMany) and value is not None:  # pragma: no cover
                 """
                 Note: Currently, ODMantic does not support mapped multi-references yet.
@@ -220,6 +359,11 @@ class ModelView(BaseModelView):
                 arranged_data[name] = [ObjectId(v) for v in value]
             else:
                 arranged_data[name] = value
+        # Fetch the related items with one query per related model
+        for (field, _), item in zip(
+            relations, await self.get_related_items(request, relations)
+        ):
+            arranged_data[field.name] = item
         return arranged_data
 
     async def _build_query(
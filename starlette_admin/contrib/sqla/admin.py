@@ -1,23 +1,32 @@
-from typing import Optional, Sequence, Union
+import os
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
 
+from jinja2 import BytecodeCache
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import (
-    FileResponse,
-    JSONResponse,
-    RedirectResponse,
-    Response,
-    StreamingResponse,
-)
+from starlette.responses import JSONResponse, RedirectResponse, Response
 from starlette.routing import Route
 from starlette_admin.auth import AuthProvider
 from starlette_admin.base import BaseAdmin
 from starlette_admin.contrib.sqla.middleware import DBSessionMiddleware
+from starlette_admin.encoders import JSONEncoder
 from starlette_admin.i18n import I18nConfig
 from starlette_admin.i18n import lazy_gettext as _
+from starlette_admin.responses import (
+    FILE_CHUNK_SIZE,
+    file_response,
+    is_not_modified,
+    iter_file,
+    not_modified_response,
+)
+from starlette_admin.thumbnails import ThumbnailCache
 from starlette_admin.views import CustomView
 
 
@@ -37,6 +46,11 @@ class Admin(BaseAdmin):
         middlewares: Optional[Sequence[Middleware]] = None,
         debug: bool = False,
         i18n_config: Optional[I18nConfig] = None,
+        json_encoder: Optional[JSONEncoder] = None,
+        templates_bytecode_cache: Optional[BytecodeCache] = None,
+        precompile_templates: bool = False,
+        file_chunk_size: int = FILE_CHUNK_SIZE,
+        thumbnail_cache: Optional[ThumbnailCache] = None,
     ) -> None:
         super().__init__(
             title=title,
@@ -51,7 +65,12 @@ class Admin(BaseAdmin):
             middlewares=middlewares,
             debug=debug,
             i18n_config=i18n_config,
+            json_encoder=json_encoder,
+            templates_bytecode_cache=templates_bytecode_cache,
+            precompile_templates=precompile_templates,
+            thumbnail_cache=thumbnail_cache,
         )
+        self.file_chunk_size = file_chunk_size
         self.middlewares = [] if self.middlewares is None else list(self.middlewares)
         self.middlewares.insert(0, Middleware(DBSessionMiddleware, engine=engine))
 
@@ -62,38 +81,94 @@ class Admin(BaseAdmin):
             self.routes.append(
                 Route(
                     "/api/file/{storage}/{file_id}",
-                    _serve_file,
+                    self._serve_file,
                     methods=["GET"],
                     name="api:file",
                 )
             )
+            if self.thumbnail_cache is not None:
+                self.routes.append(
+                    Route(
+                        "/api/thumbnail/{storage}/{file_id}",
+                        self._serve_thumbnail,
+                        methods=["GET"],
+                        name="api:thumbnail",
+                    )
+                )
         except ImportError:  # pragma: no cover
             pass
         super().mount_to(app)
 
+    async def _serve_file(self, request: Request) -> Response:
+        from libcloud.storage.types import ObjectDoesNotExistError
+        from sqlalchemy_file.storage import StorageManager
 
-def _serve_file(request: Request) -> Response:
-    from libcloud.storage.types import ObjectDoesNotExistError
-    from sqlalchemy_file.storage import StorageManager
-
-    try:
         storage = request.path_params.get("storage")
         file_id = request.path_params.get("file_id")
-        file = StorageManager.get_file(f"{storage}/{file_id}")
-        if file.object.driver.name == "Local Storage":
-            """If file is stored in local storage, just return a
-            FileResponse with the fill full path."""
-            return FileResponse(
-                file.get_cdn_url(), media_type=file.content_type, filename=file.filename  # type: ignore
+        path = f"{storage}/{file_id}"
+        # Each upload is stored with a new id, so the path identifies the content
+        if is_not_modified(request, path):
+            return not_modified_response(path)
+        try:
+            file = await run_in_threadpool(StorageManager.get_file, path)
+        except ObjectDoesNotExistError:
+            return JSONResponse({"detail": "Not found"}, status_code=404)
+        obj = file.object
+        stream: Callable[[int, int], Iterator[bytes]]
+        if obj.driver.name == "Local Storage":
+            """If file is stored in local storage, read it directly from its path"""
+            stream = partial(
+                iter_file, file.get_cdn_url(), chunk_size=self.file_chunk_size
             )
-        if file.get_cdn_url() is not None:  # pragma: no cover
+        elif file.get_cdn_url() is not None:  # pragma: no cover
             """If file has public url, redirect to this url"""
             return RedirectResponse(file.get_cdn_url())  # type: ignore
-        """Otherwise, return a streaming response"""
-        return StreamingResponse(
-            file.object.as_stream(),
+        else:
+            """Otherwise, stream the requested range from the storage"""
+            stream = partial(_iter_object, obj, chunk_size=self.file_chunk_size)
+        return file_response(
+            request,
+            stream,
+            size=obj.size,
             media_type=file.content_type,
-            headers={"Content-Disposition": f"attachment;filename={file.filename}"},
+            filename=file.filename,
+            etag=path,
+            last_modified=await run_in_threadpool(_last_modified, obj),
         )
-    except ObjectDoesNotExistError:
-        return JSONResponse({"detail": "Not found"}, status_code=404)
+
+    async def _serve_thumbnail(self, request: Request) -> Response:
+        from libcloud.storage.types import ObjectDoesNotExistError
+        from sqlalchemy_file.storage import StorageManager
+
+        assert self.thumbnail_cache is not None
+        path = "{storage}/{file_id}".format(**request.path_params)
+        try:
+            return await self.thumbnail_cache.response(
+                request,
+                path,
+                lambda: StorageManager.get_file(path).read(),
+                fallback=partial(self._serve_file, request),
+            )
+        except ObjectDoesNotExistError:
+            return JSONResponse({"detail": "Not found"}, status_code=404)
+
+
+def _iter_object(obj: Any, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+    if start == 0 and end == obj.size - 1:
+        yield from obj.as_stream(chunk_size=chunk_size)
+    else:
+        yield from obj.range_as_stream(start, end + 1, chunk_size=chunk_size)
+
+
+def _last_modified(obj: Any) -> Optional[datetime]:
+    """Return the last modification date of a libcloud object when the storage
+    driver provides it."""
+    if obj.driver.name == "Local Storage":
+        return datetime.fromtimestamp(os.path.getmtime(obj.get_cdn_url()), timezone.utc)
+    last_modified = obj.extra.get("last_modified")
+    if isinstance(last_modified, str):
+        try:
+            return parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError, IndexError):
+            return None
+    return last_modified if isinstance(last_modified, datetime) else None
@@ -36,7 +36,7 @@ class ImageField(BaseImageField):
     ) -> Any:
         try:
             return _serialize_sqlalchemy_file_library(
-                request, value, action, self.multiple
+                request, value, action, self.multiple, thumbnail=True
             )
         except (
             ImportError,
@@ -47,7 +47,11 @@ class ImageField(BaseImageField):
 
 
 def _serialize_sqlalchemy_file_library(
-    request: Request, value: Any, action: RequestAction, is_multiple: bool
+    request: Request,
+    value: Any,
+    action: RequestAction,
+    is_multiple: bool,
+    thumbnail: bool = False,
 ) -> Optional[Union[List[Dict[str, Any]], Dict[str, Any]]]:
     from sqlalchemy_file import File
 
@@ -56,13 +60,20 @@ def _serialize_sqlalchemy_file_library(
     ):
         data = []
         for item in value if isinstance(value, list) else [value]:
-            path = item["path"]
+            path, route = item["path"], "api:file"
             if (
                 action == RequestAction.LIST
                 and getattr(item, "thumbnail", None) is not None
             ):
                 """Use thumbnail on list page if available"""
                 path = item["thumbnail"]["path"]
+            elif (
+                action == RequestAction.LIST
+                and thumbnail
+                and getattr(request.app.state, "THUMBNAILS", False)
+            ):
+                """Otherwise, use the thumbnails generated by the admin"""
+                route = "api:thumbnail"
             storage, file_id = path.split("/")
             data.append(
                 {
@@ -70,7 +81,7 @@ def _serialize_sqlalchemy_file_library(
                     "filename": item["filename"],
                     "url": str(
                         request.url_for(
-                            request.app.state.ROUTE_NAME + ":api:file",
+                            request.app.state.ROUTE_NAME + ":" + route,
                             storage=storage,
                             file_id=file_id,
                         )
@@ -1,6 +1,7 @@
 from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from sqlalchemy import Column, String, and_, cast, false, not_, or_, true
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import (
     ColumnProperty,
     InstrumentedAttribute,
@@ -8,6 +9,8 @@ from sqlalchemy.orm import (
     RelationshipProperty,
 )
 from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import Executable
 from starlette_admin.contrib.sqla.converters import find_converter
 from starlette_admin.fields import BaseField, HasMany, HasOne
 from starlette_admin.helpers import slugify_class_name
@@ -36,6 +39,21 @@ OPERATORS: Dict[str, Callable[[InstrumentedAttribute, Any], ClauseElement]] = {
 }
 
 
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON)` of a statement, used to read the planner row
+    estimate on PostgreSQL."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
 def build_query(
     where: Dict[str, Any],
     model: Any,
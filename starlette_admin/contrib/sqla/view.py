@@ -1,14 +1,30 @@
-from typing import Any, Dict, List, Optional, Sequence, Type, Union
+import json
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type, Union
 
 import anyio.to_thread
-from sqlalchemy import Column, String, cast, func, inspect, or_, select
+from sqlalchemy import Column, String, cast, delete, func, inspect, or_, select
 from sqlalchemy.exc import NoInspectionAvailable, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute, Mapper, Session, joinedload
+from sqlalchemy.orm import (
+    MANYTOONE,
+    ColumnProperty,
+    InstrumentedAttribute,
+    Mapper,
+    RelationshipProperty,
+    Session,
+    joinedload,
+    load_only,
+    selectinload,
+)
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.sql import Select
 from starlette.requests import Request
+from starlette_admin._types import RequestAction
 from starlette_admin.contrib.sqla.exceptions import InvalidModelError
 from starlette_admin.contrib.sqla.helpers import (
+    Explain,
     build_order_clauses,
     build_query,
     extract_column_python_type,
@@ -20,6 +36,7 @@ from starlette_admin.fields import (
     ColorField,
     EmailField,
     FileField,
+    HasMany,
     PhoneField,
     RelationField,
     StringField,
@@ -31,6 +48,25 @@ from starlette_admin.views import BaseModelView
 
 
 class ModelView(BaseModelView):
+    """
+    Attributes:
+        bulk_delete: Delete the selected items with `DELETE ... WHERE pk IN (...)`
+            statements instead of loading them and deleting them one by one with
+            the ORM. When it is `None` (default), bulk deletes are only used when
+            the model doesn't rely on the ORM to delete its instances: no
+            inheritance, version counter, `sqlalchemy_file` columns (even when
+            excluded from the view), `before_delete` / `after_delete` mapper
+            listeners, nor relationships the ORM updates on delete (delete
+            cascades, one-to-many and many-to-many relationships without
+            `passive_deletes`). Set it to `False` if session listeners need the
+            deleted instances.
+        bulk_delete_chunk_size: Maximum number of primary keys per `DELETE`
+            statement.
+    """
+
+    bulk_delete: Optional[bool] = None
+    bulk_delete_chunk_size: int = 500
+
     def __init__(
         self,
         model: Type[Any],
@@ -72,6 +108,7 @@ class ModelView(BaseModelView):
         self.exclude_fields_from_detail = normalize_list(self.exclude_fields_from_detail)  # type: ignore
         self.exclude_fields_from_create = normalize_list(self.exclude_fields_from_create)  # type: ignore
         self.exclude_fields_from_edit = normalize_list(self.exclude_fields_from_edit)  # type: ignore
+        self.always_loaded_fields = normalize_list(self.always_loaded_fields)
         _default_list = [
             field.name
             for field in self.fields
@@ -175,19 +212,168 @@ class ModelView(BaseModelView):
         where: Union[Dict[str, Any], str, None] = None,
     ) -> int:
         session: Union[Session, AsyncSession] = request.state.session
-        stmt = self.get_count_query()
-        if where is not None:
-            if isinstance(where, dict):
-                where = build_query(where, self.model)
-            else:
-                where = await self.build_full_text_search_query(
-                    request, where, self.model
+        stmt = await self._apply_where(request, self.get_count_query(), where)
+        if isinstance(session, AsyncSession):
+            return (await session.execute(stmt)).scalar_one()
+        return (await anyio.to_thread.run_sync(session.execute, stmt)).scalar_one()
+
+    async def estimated_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+    ) -> int:
+        """
+        On PostgreSQL, return the number of rows estimated by the query planner
+        (from `pg_class.reltuples` and column statistics) for the count query
+        without executing it. Other dialects fall back to the exact count.
+        """
+        session: Union[Session, AsyncSession] = request.state.session
+        if session.bind is None or session.bind.dialect.name != "postgresql":
+            return await self.count(request, where)
+        stmt = await self._apply_where(
+            request,
+            self.get_count_query().with_only_columns(self._pk_column),
+            where,
+        )
+        if isinstance(session, AsyncSession):
+            plan = (await session.execute(Explain(stmt))).scalar_one()
+        else:
+            plan = (
+                await anyio.to_thread.run_sync(session.execute, Explain(stmt))
+            ).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return max(int(plan[0]["Plan"]["Plan Rows"]), 0)
+
+    async def capped_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+        cap: int = 10000,
+    ) -> int:
+        session: Union[Session, AsyncSession] = request.state.session
+        subquery = (
+            (
+                await self._apply_where(
+                    request,
+                    self.get_count_query().with_only_columns(self._pk_column),
+                    where,
                 )
-            stmt = stmt.where(where)  # type: ignore
+            )
+            .limit(cap + 1)
+            .subquery()
+        )
+        stmt = select(func.count()).select_from(subquery)
         if isinstance(session, AsyncSession):
             return (await session.execute(stmt)).scalar_one()
         return (await anyio.to_thread.run_sync(session.execute, stmt)).scalar_one()
 
+    def sorts_nulls_first(self, request: Request) -> bool:
+        """NULL values are larger than any other value for PostgreSQL and Oracle,
+        and smaller for the other dialects."""
+        session: Union[Session, AsyncSession] = request.state.session
+        return session.bind is None or session.bind.dialect.name not in (
+            "postgresql",
+            "oracle",
+        )
+
+    @asynccontextmanager
+    async def concurrent_session(
+        self, request: Request
+    ) -> AsyncIterator[Union[Session, AsyncSession]]:
+        """
+        Yield a new session bound to the same engine, as a session can't run
+        two queries at the same time.
+        """
+        session: Union[Session, AsyncSession] = request.state.session
+        if isinstance(session, AsyncSession):
+            async with AsyncSession(
+                session.bind, expire_on_commit=False
+            ) as concurrent_session:
+                yield concurrent_session
+        else:
+            with Session(session.bind, expire_on_commit=False) as concurrent_session:
+                yield concurrent_session
+
+    def get_relationship_loader(
+        self,
+        request: Request,
+        field: RelationField,
+        action: Optional[RequestAction],
+    ) -> Optional[LoaderOption]:
+        """
+        Return the loader option used to load the relationship behind `field`
+        for the `action` the request is processed for, or `None` to not load it
+        eagerly (the `lazy` strategy of the relationship applies).
+
+        By default, `HasOne` relationships are loaded with `joinedload` and
+        `HasMany` relationships with `selectinload`, which doesn't multiply the
+        rows of the main query. The edit form only loads the primary keys of the
+        related items and relationships of fields hidden by the action are not
+        loaded.
+
+        Override this method to pick another strategy, e.g. `raiseload` to make
+        sure a relationship is never loaded:
+
+        ```python
+        class PostView(ModelView):
+            def get_relationship_loader(self, request, field, action):
+                if field.name == "comments":
+                    return raiseload(Post.comments)
+                return super().get_relationship_loader(request, field, action)
+        ```
+        """
+        if field.name in self._hidden_relations(request, action):
+            return None
+        attr = getattr(self.model, field.name)
+        loader = selectinload(attr) if isinstance(field, HasMany) else joinedload(attr)
+        if action == RequestAction.EDIT:
+            mapper = attr.property.mapper
+            loader = loader.load_only(
+                *(
+                    mapper.get_property_by_column(column).class_attribute
+                    for column in mapper.primary_key
+                )
+            )
+        return loader
+
+    def _get_relationship_options(self, request: Request) -> List[LoaderOption]:
+        action = getattr(request.state, "action", None)
+        options = []
+        for field in self.fields:
+            if isinstance(field, RelationField):
+                loader = self.get_relationship_loader(request, field, action)
+                if loader is not None:
+                    options.append(loader)
+        return options
+
+    def _get_column_projection(
+        self, request: Request, order_by: Optional[List[str]] = None
+    ) -> Optional[LoaderOption]:
+        """Return a `load_only` option for the columns displayed by the action
+        the request is processed for, or `None` to load all the columns."""
+        names = self._projected_fields(request, self.model)
+        if names is None:
+            return None
+        mapper: Mapper = inspect(self.model)  # type: ignore
+        columns = []
+        for name in names:
+            prop = mapper.attrs.get(name)
+            if isinstance(prop, ColumnProperty):
+                columns.append(prop.class_attribute)
+            elif isinstance(prop, RelationshipProperty):
+                columns.extend(
+                    mapper.get_property_by_column(column).class_attribute
+                    for column in prop.local_columns
+                )
+            else:
+                return None  # e.g. hybrid property, depends on unknown columns
+        for value in order_by or []:  # needed to build keyset pagination cursors
+            prop = mapper.attrs.get(value.strip().split(maxsplit=1)[0])
+            if isinstance(prop, ColumnProperty):
+                columns.append(prop.class_attribute)
+        return load_only(*columns)
+
     async def find_all(
         self,
         request: Request,
@@ -200,18 +386,12 @@ class ModelView(BaseModelView):
         stmt = self.get_list_query().offset(skip)
         if limit > 0:
             stmt = stmt.limit(limit)
-        if where is not None:
-            if isinstance(where, dict):
-                where = build_query(where, self.model)
-            else:
-                where = await self.build_full_text_search_query(
-                    request, where, self.model
-                )
-            stmt = stmt.where(where)  # type: ignore
+        stmt = await self._apply_where(request, stmt, where)
         stmt = stmt.order_by(*build_order_clauses(order_by or [], self.model))
-        for field in self.fields:
-            if isinstance(field, RelationField):
-                stmt = stmt.options(joinedload(getattr(self.model, field.name)))
+        stmt = stmt.options(*self._get_relationship_options(request))
+        projection = self._get_column_projection(request, order_by)
+        if projection is not None:
+            stmt = stmt.options(projection)
         if isinstance(session, AsyncSession):
             return (await session.execute(stmt)).scalars().unique().all()
         return (
@@ -221,12 +401,60 @@ class ModelView(BaseModelView):
             .all()
         )
 
+    async def iter_all(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+        order_by: Optional[List[str]] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Iterate over all items with a single query, fetching `chunk_size` rows
+        at a time from a server-side cursor (`yield_per`) instead of buffering
+        the whole result. Relationships are loaded with `selectinload`, once per
+        chunk, as joined eager loading of collections can't be used with `yield_per`.
+        """
+        session: Union[Session, AsyncSession] = request.state.session
+        stmt = await self._apply_where(request, self.get_list_query(), where)
+        stmt = stmt.order_by(*build_order_clauses(order_by or [], self.model))
+        hidden_relations = self._hidden_relations(
+            request, getattr(request.state, "action", None)
+        )
+        for field in self.fields:
+            if isinstance(field, RelationField) and field.name not in hidden_relations:
+                stmt = stmt.options(selectinload(getattr(self.model, field.name)))
+        stmt = stmt.execution_options(yield_per=chunk_size)
+        if isinstance(session, AsyncSession):
+            async_result = await session.stream(stmt)
+            try:
+                async for partition in async_result.scalars().partitions():
+                    yield partition
+            finally:
+                await async_result.close()
+        else:
+            result = await anyio.to_thread.run_sync(session.execute, stmt)
+            try:
+                scalars = result.scalars()
+                while True:
+                    partition = await anyio.to_thread.run_sync(
+                        scalars.fetchmany, chunk_size
+                    )
+                    if len(partition) == 0:
+                        break
+                    yield partition
+            finally:
+                result.close()
+
+    def coerce_pk(self, pk: Any) -> Any:
+        return pk if isinstance(pk, self._pk_coerce) else self._pk_coerce(pk)
+
     async def find_by_pk(self, request: Request, pk: Any) -> Any:
         session: Union[Session, AsyncSession] = request.state.session
         stmt = select(self.model).where(self._pk_column == self._pk_coerce(pk))
-        for field in self.fields:
-            if isinstance(field, RelationField):
-                stmt = stmt.options(joinedload(getattr(self.model, field.name)))
+        stmt = stmt.options(*self._get_relationship_options(request))
+        projection = self._get_column_projection(request)
+        if projection is not None:
+            stmt = stmt.options(projection)
         if isinstance(session, AsyncSession):
             return (await session.execute(stmt)).scalars().unique().one_or_none()
         return (
@@ -239,9 +467,7 @@ class ModelView(BaseModelView):
     async def find_by_pks(self, request: Request, pks: List[Any]) -> Sequence[Any]:
         session: Union[Session, AsyncSession] = request.state.session
         stmt = select(self.model).where(self._pk_column.in_(map(self._pk_coerce, pks)))
-        for field in self.fields:
-            if isinstance(field, RelationField):
-                stmt = stmt.options(joinedload(getattr(self.model, field.name)))
+        stmt = stmt.options(*self._get_relationship_options(request))
         if isinstance(session, AsyncSession):
             return (await session.execute(stmt)).scalars().unique().all()
         return (
@@ -317,7 +543,7 @@ class ModelView(BaseModelView):
             data = await self._arrange_data(request, data, True)
             await self.validate(request, data)
             session: Union[Session, AsyncSession] = request.state.session
-            obj = await self.find_by_pk(request, pk)
+            obj = await self.get_by_pk(request, pk)
             session.add(await self._populate_obj(request, obj, data, True))
             if isinstance(session, AsyncSession):
                 await session.commit()
@@ -340,23 +566,20 @@ class ModelView(BaseModelView):
         database.
         """
         arranged_data: Dict[str, Any] = {}
+        relations = []
         for field in self.fields:
             if (is_edit and field.exclude_from_edit) or (
                 not is_edit and field.exclude_from_create
             ):
                 continue
+            arranged_data[field.name] = data[field.name]
             if isinstance(field, RelationField) and data[field.name] is not None:
-                foreign_model = self._find_foreign_model(field.identity)  # type: ignore
-                if not field.multiple:
-                    arranged_data[field.name] = await foreign_model.find_by_pk(
-                        request, data[field.name]
-                    )
-                else:
-                    arranged_data[field.name] = await foreign_model.find_by_pks(
-                        request, data[field.name]
-                    )
-            else:
-                arranged_data[field.name] = data[field.name]
+                relations.append((field, data[field.name]))
+        # Fetch the related items with one query per related model
+        for (field, _), items in zip(
+            relations, await self.get_related_items(request, relations)
+        ):
+            arranged_data[field.name] = items
         return arranged_data
 
     async def _populate_obj(
@@ -386,6 +609,22 @@ class ModelView(BaseModelView):
 
     async def delete(self, request: Request, pks: List[Any]) -> Optional[int]:
         session: Union[Session, AsyncSession] = request.state.session
+        if self.bulk_delete or (self.bulk_delete is None and self._can_bulk_delete()):
+            size = self.bulk_delete_chunk_size
+            values = [self._pk_coerce(pk) for pk in pks]
+            stmts = [
+                delete(self.model).where(self._pk_column.in_(values[i : i + size]))
+                for i in range(0, len(values), size)
+            ]
+            if isinstance(session, AsyncSession):
+                deleted = 0
+                for stmt in stmts:
+                    deleted += (await session.execute(stmt)).rowcount  # type: ignore
+                await session.commit()
+                return deleted
+            return await anyio.to_thread.run_sync(
+                partial(_execute_deletes, session, stmts)
+            )
         objs = await self.find_by_pks(request, pks)
         if isinstance(session, AsyncSession):
             for obj in objs:
@@ -397,6 +636,42 @@ class ModelView(BaseModelView):
             await anyio.to_thread.run_sync(session.commit)
         return len(objs)
 
+    def _can_bulk_delete(self) -> bool:
+        """Return True when the items can be deleted without being loaded, see
+        `bulk_delete`."""
+        mapper: Mapper = inspect(self.model)  # type: ignore
+        if (
+            mapper.inherits is not None
+            or len(mapper.self_and_descendants) > 1
+            or mapper.version_id_col is not None
+            or mapper.dispatch.before_delete
+            or mapper.dispatch.after_delete
+            or _has_file_columns(mapper)
+        ):
+            return False
+        return not any(
+            not rel.viewonly
+            and (
+                rel.cascade.delete
+                or (rel.direction is not MANYTOONE and not rel.passive_deletes)
+            )
+            for rel in mapper.relationships
+        )
+
+    async def _apply_where(
+        self,
+        request: Request,
+        stmt: Select,
+        where: Union[Dict[str, Any], str, None] = None,
+    ) -> Select:
+        if where is None:
+            return stmt
+        if isinstance(where, dict):
+            return stmt.where(build_query(where, self.model))
+        return stmt.where(
+            await self.build_full_text_search_query(request, where, self.model)
+        )
+
     async def build_full_text_search_query(
         self, request: Request, term: str, model: Any
     ) -> Any:
@@ -411,3 +686,19 @@ class ModelView(BaseModelView):
         except ImportError:  # pragma: no cover
             pass
         raise exc  # pragma: no cover
+
+
+def _execute_deletes(session: Session, stmts: List[Any]) -> int:
+    deleted = sum(session.execute(stmt).rowcount for stmt in stmts)  # type: ignore
+    session.commit()
+    return deleted
+
+
+def _has_file_columns(mapper: Mapper) -> bool:
+    """Return True when the model has sqlalchemy_file columns, whose files are
+    removed by session listeners when the instances are deleted."""
+    try:
+        from sqlalchemy_file.types import FileField as FileColumn
+    except ImportError:  # pragma: no cover
+        return False
+    return any(isinstance(column.type, FileColumn) for column in mapper.columns)
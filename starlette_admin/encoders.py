@@ -0,0 +1,67 @@
+import datetime
+import json
+from enum import Enum
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+JSONEncoder = Callable[[Any], bytes]
+"""Callable serializing a python object into JSON bytes."""
+
+
+def default(obj: Any) -> Any:
+    """Convert values that are not natively JSON serializable.
+
+    datetimes are formatted in ISO 8601, Enums are converted to their value
+    and sets to lists. Any other object (Decimal, UUID, ObjectId, ...) is
+    converted to string.
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def stdlib_json_encoder(obj: Any) -> bytes:
+    """Encode `obj` with the standard library `json` module."""
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=default,
+    ).encode("utf-8")
+
+
+def orjson_encoder(obj: Any) -> bytes:
+    """Encode `obj` with [orjson](https://github.com/ijl/orjson)."""
+    assert orjson is not None, "'orjson' package is required"
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def msgspec_encoder(obj: Any) -> bytes:
+    """Encode `obj` with [msgspec](https://github.com/jcrist/msgspec)."""
+    assert msgspec is not None, "'msgspec' package is required"
+    return msgspec.json.encode(obj, enc_hook=default)
+
+
+def get_json_encoder() -> JSONEncoder:
+    """Return the fastest available encoder: orjson, then msgspec, then
+    the standard library."""
+    if orjson is not None:
+        return orjson_encoder
+    if msgspec is not None:  # pragma: no cover
+        return msgspec_encoder
+    return stdlib_json_encoder  # pragma: no cover
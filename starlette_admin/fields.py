@@ -6,6 +6,7 @@ from dataclasses import field as dc_field
 from datetime import date, datetime, time
 from enum import Enum, IntEnum
 from json import JSONDecodeError
+from time import monotonic
 from typing import (
     Any,
     Callable,
@@ -157,6 +158,39 @@ class BaseField:
         """
         return value
 
+    async def serialize_values(
+        self, request: Request, values: Sequence[Any], action: RequestAction
+    ) -> List[Any]:
+        """Formats the values of this field for several objects at once.
+
+        By default, values are formatted with `serialize_none_value` and `serialize_value`.
+        For built-in fields whose serialization is synchronous, these coroutines are
+        skipped unless they are overridden. Override this method to vectorize a custom
+        serialization.
+
+        Args:
+            request: The current request object.
+            values: The values to format.
+            action: The current request action.
+
+        Returns:
+            List[Any]: The formatted values, in the same order.
+        """
+        serializer = _SYNC_SERIALIZERS.get(type(self).serialize_value)
+        if (
+            serializer is not None
+            and type(self).serialize_none_value is BaseField.serialize_none_value
+        ):
+            return [None if value is None else serializer(value) for value in values]
+        return [
+            (
+                await self.serialize_none_value(request, action)
+                if value is None
+                else await self.serialize_value(request, value, action)
+            )
+            for value in values
+        ]
+
     def additional_css_links(
         self, request: Request, action: RequestAction
     ) -> List[str]:
@@ -493,6 +527,10 @@ class EnumField(StringField):
                 )
             ]
         ```
+
+    Labels of static choices are looked up in a dictionary. The `choices_loader`
+    is called at most once per request, set `choices_cache_ttl` to also keep
+    its result, per locale, for the given number of seconds.
     """
 
     multiple: bool = False
@@ -501,6 +539,7 @@ class EnumField(StringField):
     choices_loader: Optional[
         Callable[[Request], Union[Sequence[str], Sequence[Tuple[Any, str]]]]
     ] = dc_field(default=None, compare=False)
+    choices_cache_ttl: Optional[float] = dc_field(default=None, compare=False)
     form_template: str = "forms/enum.html"
     class_: str = "field-enum form-control form-select"
     coerce: Callable[[Any], Any] = str
@@ -516,6 +555,10 @@ class EnumField(StringField):
             raise ValueError(
                 "EnumField required a list of choices, enum class or a choices_loader for dynamic choices"
             )
+        self._static_labels: Tuple[Any, Optional[Dict[Any, str]]] = (None, None)
+        self._cached_choices: Dict[
+            str, Tuple[float, Any, Optional[Dict[Any, str]]]
+        ] = {}
         super().__post_init__()
 
     async def parse_form_data(
@@ -530,16 +573,50 @@ class EnumField(StringField):
         )
 
     def _get_choices(self, request: Request) -> Any:
-        return (
-            self.choices
-            if self.choices_loader is None
-            else self.choices_loader(request)
-        )
+        return self._load_choices(request)[0]
+
+    def _load_choices(self, request: Request) -> Tuple[Any, Optional[Dict[Any, str]]]:
+        """Return the choices with a value to label dictionary, None when the
+        values are not hashable."""
+        if self.choices_loader is None:
+            if self._static_labels[0] is not self.choices:
+                self._static_labels = (self.choices, _labels_dict(self.choices))
+            return self.choices, self._static_labels[1]
+        try:
+            loaded = request.state.enum_choices
+        except AttributeError:
+            loaded = request.state.enum_choices = {}
+        if id(self) not in loaded:
+            loaded[id(self)] = self._call_choices_loader(request)
+        return loaded[id(self)]
+
+    def _call_choices_loader(
+        self, request: Request
+    ) -> Tuple[Any, Optional[Dict[Any, str]]]:
+        assert self.choices_loader is not None
+        if self.choices_cache_ttl is None:
+            choices = self.choices_loader(request)
+            return choices, _labels_dict(choices)
+        locale, now = get_locale(), monotonic()
+        cached = self._cached_choices.get(locale)
+        if cached is None or cached[0] <= now:
+            choices = self.choices_loader(request)
+            cached = (now + self.choices_cache_ttl, choices, _labels_dict(choices))
+            self._cached_choices[locale] = cached
+        return cached[1], cached[2]
 
     def _get_label(self, value: Any, request: Request) -> Any:
         if isinstance(value, Enum):
             return value.name.replace("_", " ")
-        for v, label in self._get_choices(request):
+        choices, labels = self._load_choices(request)
+        if labels is not None:
+            try:
+                return labels[value]
+            except KeyError:
+                raise ValueError(f"Invalid choice value: {value}") from None
+            except TypeError:  # Unhashable value
+                pass
+        for v, label in choices:
             if value == v:
                 return label
         raise ValueError(f"Invalid choice value: {value}")
@@ -634,6 +711,9 @@ class CountryField(EnumField):
                 "'babel' package is required to use 'CountryField'. Install it with `pip install starlette-admin[i18n]`"
             ) from err
         self.choices_loader = lambda request: get_countries_list()
+        if self.choices_cache_ttl is None:
+            """The list only depends on the locale"""
+            self.choices_cache_ttl = float("inf")
         super().__post_init__()
 
 
@@ -652,6 +732,9 @@ class CurrencyField(EnumField):
                 "'babel' package is required to use 'CurrencyField'. Install it with `pip install starlette-admin[i18n]`"
             ) from err
         self.choices_loader = lambda request: get_currencies_list()
+        if self.choices_cache_ttl is None:
+            """The list only depends on the locale"""
+            self.choices_cache_ttl = float("inf")
         super().__post_init__()
 
 
@@ -1222,3 +1305,22 @@ class ListField(BaseField):
 
     def additional_js_links(self, request: Request, action: RequestAction) -> List[str]:
         return self.field.additional_js_links(request, action)
+
+
+# Synchronous equivalents of the built-in `serialize_value` implementations,
+# used by `BaseField.serialize_values` when they are not overridden.
+_SYNC_SERIALIZERS: Dict[Callable[..., Any], Callable[[Any], Any]] = {
+    BaseField.serialize_value: lambda value: value,
+    BooleanField.serialize_value: bool,
+    StringField.serialize_value: str,
+    IntegerField.serialize_value: int,
+    DecimalField.serialize_value: str,
+    FloatField.serialize_value: float,
+}
+
+
+def _labels_dict(choices: Any) -> Optional[Dict[Any, str]]:
+    try:
+        return dict(reversed(list(choices)))
+    except TypeError:  # Unhashable values
+        return None
@@ -1,11 +1,33 @@
+import base64
+import binascii
+import decimal
+import enum
+import json
 import os
 import re
-from typing import TYPE_CHECKING, Any, Dict, Sequence, Tuple, Union
+import uuid
+from datetime import date, datetime, time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from markupsafe import escape
 from starlette_admin._types import RequestAction
 from starlette_admin.exceptions import FormValidationError
 
+try:
+    from bson import ObjectId
+except ImportError:  # pragma: no cover
+    ObjectId = None  # type: ignore
+
 if TYPE_CHECKING:
     from starlette_admin.fields import BaseField
 
@@ -104,3 +126,85 @@ def pydantic_error_to_form_validation_errors(exc: Any) -> FormValidationError:
                 _d[loc[i]] = {}
             _d = _d[loc[i]]
     return FormValidationError(errors)
+
+
+def _dump_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, decimal.Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"$uuid": str(value)}
+    if ObjectId is not None and isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+    if value is None:
+        return None
+    if isinstance(value, (str, int, float)) and not isinstance(value, enum.Enum):
+        return value
+    raise TypeError(f"{type(value).__name__} values are not supported in cursors")
+
+
+_CURSOR_VALUE_LOADERS: Dict[str, Callable[[str], Any]] = {
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+    "$time": time.fromisoformat,
+    "$decimal": decimal.Decimal,
+    "$uuid": uuid.UUID,
+}
+
+
+def _load_object_id(value: str) -> Any:
+    if not ObjectId.is_valid(value):
+        raise ValueError(f"Invalid ObjectId: {value}")
+    return ObjectId(value)
+
+
+if ObjectId is not None:
+    _CURSOR_VALUE_LOADERS["$oid"] = _load_object_id
+
+
+def _load_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((tag, raw),) = value.items()
+        return _CURSOR_VALUE_LOADERS[tag](raw)
+    return value
+
+
+def encode_cursor(order_by: Sequence[str], values: Sequence[Any]) -> str:
+    """Encode the sort key values of a row into an opaque, url-safe pagination cursor.
+
+    Common python types (datetime, date, time, Decimal, UUID) and the `ObjectId`
+    primary keys of MongoDB documents are tagged so that
+    [decode_cursor][starlette_admin.helpers.decode_cursor] can restore them.
+    Raise `TypeError` for the other types (except None, str, int and float), whose
+    values could not be restored, e.g. Enum members.
+    """
+    payload = json.dumps(
+        {"o": list(order_by), "v": [_dump_cursor_value(v) for v in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[List[str], List[Any]]]:
+    """Decode a cursor produced by [encode_cursor][starlette_admin.helpers.encode_cursor].
+
+    Returns the order clauses and the values, or None if the cursor is invalid.
+    """
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        return list(payload["o"]), [_load_cursor_value(v) for v in payload["v"]]
+    except (
+        binascii.Error,
+        decimal.InvalidOperation,
+        KeyError,
+        TypeError,
+        ValueError,
+    ):
+        return None
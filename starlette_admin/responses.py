@@ -0,0 +1,198 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import quote
+
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+FILE_CACHE_CONTROL = "private, max-age=86400"
+"""Default `Cache-Control` header of the served files."""
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+class _RangeNotSatisfiable(Exception):
+    pass
+
+
+def is_not_modified(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime] = None
+) -> bool:
+    """Return True when the conditional headers of the request (`If-None-Match`,
+    then `If-Modified-Since`) match the current version of the resource."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(etag, if_none_match)
+    if_modified_since = _parse_http_date(request.headers.get("if-modified-since"))
+    if if_modified_since is not None and last_modified is not None:
+        return _to_utc(last_modified).replace(microsecond=0) <= if_modified_since
+    return False
+
+
+def not_modified_response(
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+    cache_control: str = FILE_CACHE_CONTROL,
+) -> Response:
+    return Response(
+        status_code=304, headers=_cache_headers(etag, last_modified, cache_control)
+    )
+
+
+def file_response(
+    request: Request,
+    stream: Callable[[int, int], Iterator[bytes]],
+    size: int,
+    media_type: str,
+    filename: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = FILE_CACHE_CONTROL,
+) -> Response:
+    """
+    Return a streaming response of a file, answering conditional requests with
+    `304 Not Modified` and single range requests with `206 Partial Content`.
+
+    Parameters:
+        request: The request being processed
+        stream: Called with the first and the last (inclusive) byte positions
+            to serve, returns an iterator over the bytes of this range. Sync
+            iterators are consumed in the threadpool.
+        size: The file size in bytes
+        media_type: The file content type
+        filename: The file name, used in the `Content-Disposition` header
+        etag: Unquoted entity tag of the file
+        last_modified: Last modification date of the file
+        cache_control: The `Cache-Control` header
+    """
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, cache_control)
+    headers = _cache_headers(etag, last_modified, cache_control)
+    headers["Accept-Ranges"] = "bytes"
+    headers["Content-Disposition"] = _content_disposition(filename)
+    start, end, status_code = 0, size - 1, 200
+    range_header = request.headers.get("range")
+    if range_header is not None and _if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except _RangeNotSatisfiable:
+            return Response(
+                status_code=416, headers={"Content-Range": f"bytes */{size}"}
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        stream(start, end) if end >= start else iter(()),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def iter_file(
+    path: str, start: int, end: int, chunk_size: int = FILE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Iterate over the bytes `start` to `end` (inclusive) of a local file."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if len(chunk) == 0:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _cache_headers(
+    etag: Optional[str], last_modified: Optional[datetime], cache_control: str
+) -> Dict[str, str]:
+    headers = {"Cache-Control": cache_control}
+    if etag is not None:
+        headers["ETag"] = f'"{etag}"'
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+    return headers
+
+
+def _content_disposition(filename: str) -> str:
+    quoted_filename = quote(filename)
+    if quoted_filename != filename:
+        return f"attachment; filename*=utf-8''{quoted_filename}"
+    return f'attachment; filename="{filename}"'
+
+
+def _etag_matches(etag: str, header: str) -> bool:
+    values = [value.strip() for value in header.split(",")]
+    return any(value == "*" or _unquote_etag(value) == etag for value in values)
+
+
+def _unquote_etag(value: str) -> str:
+    if value.startswith("W/"):
+        value = value[2:]
+    return value.strip('"')
+
+
+def _if_range_matches(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime]
+) -> bool:
+    """Return False when `If-Range` doesn't match the current version of the
+    file, in which case the whole file is served."""
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if if_range.startswith('"'):
+        return etag is not None and if_range.strip('"') == etag
+    if_range_date = _parse_http_date(if_range)
+    return (
+        if_range_date is not None
+        and last_modified is not None
+        and _to_utc(last_modified).replace(microsecond=0) == if_range_date
+    )
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Return the first and the last (inclusive) byte positions requested by a
+    `Range` header. Return None when the header is invalid or requests multiple
+    ranges, which are not supported."""
+    unit, _, byte_range = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in byte_range:
+        return None
+    first, sep, last = byte_range.strip().partition("-")
+    if sep != "-":
+        return None
+    try:
+        if not first:  # Suffix range: the last `last` bytes
+            length = int(last)
+            if length <= 0 or size == 0:
+                raise _RangeNotSatisfiable()
+            return max(size - length, 0), size - 1
+        start = int(first)
+        end = int(last) if last else None
+    except ValueError:
+        return None
+    if start < 0 or (end is not None and end < start):
+        return None
+    if start >= size:
+        raise _RangeNotSatisfiable()
+    return start, size - 1 if end is None else min(end, size - 1)
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        return _to_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Convert `value` to UTC, naive datetimes being considered as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
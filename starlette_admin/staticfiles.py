@@ -0,0 +1,203 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import stat
+import sys
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import anyio.to_thread
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.routing import Mount
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+"""`Cache-Control` header of the fingerprinted static files."""
+
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".json", ".map", ".svg", ".ttf", ".txt")
+
+_FINGERPRINT_LENGTH = 12
+_FINGERPRINTED_PATH = re.compile(
+    r"^(?P<base>.+)\.(?P<fingerprint>[0-9a-f]{%d})(?P<ext>\.[^./]+)$"
+    % _FINGERPRINT_LENGTH
+)
+# Precompressed siblings, by order of preference
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class AdminStaticFiles(StaticFiles):
+    """
+    StaticFiles serving the admin assets under fingerprinted names (e.g.
+    `js/vendor/jquery.min.1a2b3c4d5e6f.js`) with an immutable `Cache-Control`,
+    and the precompressed `.br` / `.gz` siblings of the files when the client
+    accepts them. Run `python -m starlette_admin.staticfiles <directory>` to
+    generate these siblings.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._fingerprints = self._compute_fingerprints()
+
+    def _compute_fingerprints(self) -> Dict[str, str]:
+        """Hash the content of every file served, once, so that building their
+        URLs doesn't read them. Paths found in several directories get the hash
+        of the file served, from the first directory."""
+        fingerprints: Dict[str, str] = {}
+        for directory in self.all_directories:
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    if name.endswith(tuple(suffix for _, suffix in _ENCODINGS)):
+                        continue
+                    full_path = os.path.join(root, name)
+                    path = os.path.relpath(full_path, directory).replace(os.sep, "/")
+                    if path not in fingerprints:
+                        with open(full_path, "rb") as f:
+                            digest = hashlib.md5(f.read()).hexdigest()
+                        fingerprints[path] = digest[:_FINGERPRINT_LENGTH]
+        return fingerprints
+
+    def fingerprint(self, path: str) -> Optional[str]:
+        """Return the hash of the content of the file at `path`, None if it
+        doesn't exist. Hashes are computed when the instance is created, the
+        application must be restarted to serve modified files under new URLs."""
+        return self._fingerprints.get(path)
+
+    def fingerprinted_path(self, path: str) -> str:
+        """Return the fingerprinted name of the file at `path`, `path` itself
+        when the file doesn't exist."""
+        fingerprint = self.fingerprint(path)
+        if fingerprint is None:
+            return path
+        base, ext = os.path.splitext(path)
+        return f"{base}.{fingerprint}{ext}" if ext else f"{path}.{fingerprint}"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        immutable = False
+        match = _FINGERPRINTED_PATH.match(path)
+        if match is not None:
+            original = match.group("base") + match.group("ext")
+            fingerprint = self.fingerprint(original)
+            if fingerprint is not None:
+                # Serve the current version, the old ones are not kept
+                path, immutable = original, fingerprint == match.group("fingerprint")
+        response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+        if immutable:
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    async def _precompressed_response(
+        self, path: str, scope: Scope
+    ) -> Optional[Response]:
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+        request_headers = Headers(scope=scope)
+        accepted = {
+            value.split(";")[0].strip().lower()
+            for value in request_headers.get("accept-encoding", "").split(",")
+        }
+        encodings = [
+            (encoding, suffix)
+            for encoding, suffix in _ENCODINGS
+            if encoding in accepted
+        ]
+        if len(encodings) == 0:
+            return None
+        found = await anyio.to_thread.run_sync(
+            partial(self._lookup_precompressed, path, encodings)
+        )
+        if found is None:
+            return None
+        encoding, full_path, stat_result = found
+        response = FileResponse(
+            full_path,
+            stat_result=stat_result,
+            method=scope["method"],
+            media_type=mimetypes.guess_type(path)[0] or "text/plain",
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _lookup_precompressed(
+        self, path: str, encodings: List[Tuple[str, str]]
+    ) -> Optional[Tuple[str, str, os.stat_result]]:
+        """Return the encoding, the path and the stat of the first precompressed
+        sibling of the file served for `path`. Only the directory of this file is
+        searched, and the siblings older than the file are ignored."""
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+        for encoding, suffix in encodings:
+            try:
+                sibling_stat = os.stat(full_path + suffix)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if (
+                stat.S_ISREG(sibling_stat.st_mode)
+                and sibling_stat.st_mtime >= stat_result.st_mtime
+            ):
+                return encoding, full_path + suffix, sibling_stat
+        return None
+
+
+class StaticFilesMount(Mount):
+    """Mount of [AdminStaticFiles][starlette_admin.staticfiles.AdminStaticFiles]
+    generating fingerprinted URLs with `url_for(<name>, path=...)`."""
+
+    def __init__(self, path: str, app: AdminStaticFiles, name: str) -> None:
+        super().__init__(path, app=app, name=name)
+        self.statics = app
+
+    def url_path_for(self, __name: str, **path_params: Any) -> Any:
+        if __name == self.name and "path" in path_params:
+            path_params["path"] = self.statics.fingerprinted_path(
+                path_params["path"].lstrip("/")
+            )
+        return super().url_path_for(__name, **path_params)
+
+
+def compress_directory(directory: str, min_size: int = 1024) -> List[str]:
+    """
+    Write the gzip (and brotli, when the `brotli` package is installed) compressed
+    siblings of the text assets in `directory`, keeping only those smaller than
+    the original file. Return the paths of the written files.
+    """
+    written = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                content = f.read()
+            if len(content) < min_size:
+                continue
+            variants = [(".gz", gzip.compress(content, 9))]
+            if brotli is not None:
+                variants.append((".br", brotli.compress(content)))
+            for suffix, compressed in variants:
+                if len(compressed) < len(content):
+                    with open(path + suffix, "wb") as f:
+                        f.write(compressed)
+                    written.append(path + suffix)
+    return written
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for directory in sys.argv[1:] or [
+        os.path.join(os.path.dirname(__file__), "statics")
+    ]:
+        for path in compress_directory(directory):
+            print(path)
@@ -55,7 +55,10 @@
                 return obj;
               }),
               pagination: {
-                more: (params.page || 1) * 20 < data.total,
+                more:
+                  data.total === null
+                    ? data.items.length === 20
+                    : (params.page || 1) * 20 < data.total,
               },
             };
           },
@@ -5,6 +5,21 @@ $(function () {
   /* list of primary keys of selected rows */
   var selectedRows = [];
 
+  /*
+  cursor returned by the last request (keyset pagination), only reused
+  when the user moves to the next page with the same query.
+  */
+  var keyset = { cursor: null, start: null, query: null };
+
+  /*
+  total returned by the last request, null when items are not counted
+  (see model.countStrategy)
+  */
+  var lastTotal = 0;
+
+  /* parameters of the last request, reused by server-side exports */
+  var lastQuery = { order_by: [] };
+
   /*
   contains all fields including nested fields inside all CollectionField.
   Each nested field name is prefixed by it parent CollectionField name (ex: 'category.name')
@@ -123,6 +138,21 @@ $(function () {
         orthogonal: "export-print",
       },
     });
+  /* server-side exports include all items matching the current query */
+  model.serverExportFormats.forEach((format) => {
+    export_buttons.push({
+      text: function (dt) {
+        return `<i class="fa-solid fa-file-arrow-down"></i> ${dt.i18n(
+          `starlette-admin.buttons.${format}All`
+        )}`;
+      },
+      action: function (e, dt) {
+        let params = { format: format, order_by: lastQuery.order_by };
+        if (lastQuery.where) params.where = lastQuery.where;
+        window.location.href = `${model.exportUrl}?${$.param(params, true)}`;
+      },
+    });
+  });
   if (export_buttons.length > 0)
     buttons.push({
       extend: "collection",
@@ -284,6 +314,24 @@ $(function () {
         right: `<svg xmlns="http://www.w3.org/2000/svg" class="icon icon-tabler icon-tabler-chevron-right" width="24" height="24" viewBox="0 0 24 24" stroke-width="2" stroke="currentColor" fill="none" stroke-linecap="round" stroke-linejoin="round"><path stroke="none" d="M0 0h24v24H0z" fill="none"></path><polyline points="9 6 15 12 9 18"></polyline></svg>`,
       },
     },
+    infoCallback: function (settings, start, end, max, total, pre) {
+      if (end === 0) return pre;
+      if (lastTotal === null)
+        return `${settings.fnFormatNumber(start)} - ${settings.fnFormatNumber(
+          end
+        )}`;
+      let label;
+      if (model.countStrategy === "estimated")
+        label = "~" + settings.fnFormatNumber(lastTotal);
+      else if (model.countStrategy === "capped" && lastTotal > model.countCap)
+        label = settings.fnFormatNumber(model.countCap) + "+";
+      else return pre;
+      /* replace the last occurrence of the total in the translated string */
+      const formatted = settings.fnFormatNumber(total);
+      const idx = pre.lastIndexOf(formatted);
+      if (idx < 0) return pre;
+      return pre.substring(0, idx) + label + pre.substring(idx + formatted.length);
+    },
     ajax: function (data, callback, settings) {
       // console.log(data);
       order = [];
@@ -303,6 +351,15 @@ $(function () {
       };
       if (data.search.value != "") query.where = data.search.value;
       else if (where) query.where = JSON.stringify(where);
+      lastQuery = query;
+      let queryKey = JSON.stringify([query.where, query.limit, query.order_by]);
+      if (
+        model.keysetPagination &&
+        keyset.cursor &&
+        keyset.query === queryKey &&
+        keyset.start === query.skip
+      )
+        query.cursor = keyset.cursor;
       $.ajax({
         url: model.apiUrl,
         type: "get",
@@ -310,11 +367,29 @@ $(function () {
         traditional: true,
         dataType: "json",
         success: function (data, status, xhr) {
+          keyset = {
+            cursor: data.next_cursor,
+            start: query.skip + query.limit,
+            query: queryKey,
+          };
           total = data.total;
           data = data.items;
           data.forEach((d) => {
             d.DT_RowId = d[model.pk];
           });
+          lastTotal = total;
+          if (
+            total === null ||
+            (model.countStrategy === "capped" && total > model.countCap)
+          ) {
+            /* keep the next page reachable while the current one is full */
+            total = Math.max(
+              total || 0,
+              query.skip +
+                data.length +
+                (data.length > 0 && data.length === query.limit ? 1 : 0)
+            );
+          }
           callback({
             recordsFiltered: total,
             data: data,
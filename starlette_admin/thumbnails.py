@@ -0,0 +1,207 @@
+import contextlib
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from functools import partial
+from typing import Awaitable, Callable, Iterator, List, Optional, Set, Tuple
+
+import anyio
+import anyio.to_process
+import anyio.to_thread
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette_admin.responses import (
+    file_response,
+    is_not_modified,
+    iter_file,
+    not_modified_response,
+)
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    Image = None  # type: ignore
+
+THUMBNAIL_CACHE_CONTROL = "private, max-age=31536000, immutable"
+"""`Cache-Control` header of the served thumbnails."""
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class ThumbnailCache:
+    """
+    Generate the thumbnails of the images displayed in List pages and keep them
+    in a directory, the least recently used thumbnails being removed when the
+    cache exceeds `max_size`. Thumbnails are generated with
+    [Pillow](https://python-pillow.org) in worker processes.
+
+    Parameters:
+        directory: Directory where the thumbnails are stored. Default to a
+            `starlette-admin-thumbnails` directory in the temporary directory.
+        size: Maximum width and height of the thumbnails.
+        max_size: Maximum size of the cache in bytes.
+        max_workers: Maximum number of worker processes generating thumbnails
+            at the same time. Default to the anyio default process limiter
+            (number of CPUs).
+
+    Example:
+        ```python
+        admin = Admin(engine, thumbnail_cache=ThumbnailCache(size=(64, 64)))
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        size: Tuple[int, int] = (128, 128),
+        max_size: int = 100 * 1024 * 1024,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        assert Image is not None, "'Pillow' package is required"
+        self.directory = directory or os.path.join(
+            tempfile.gettempdir(), "starlette-admin-thumbnails"
+        )
+        self.size = size
+        self.max_size = max_size
+        self.max_workers = max_workers
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+        self._failures: Set[str] = set()
+        self._total_size: Optional[int] = None
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    async def response(
+        self,
+        request: Request,
+        key: str,
+        load: Callable[[], bytes],
+        fallback: Optional[Callable[[], Awaitable[Response]]] = None,
+    ) -> Response:
+        """
+        Return a response serving the thumbnail of the image identified by `key`.
+
+        Parameters:
+            request: The request being processed
+            key: Unique identifier of the image content
+            load: Called in a worker thread to read the original image when its
+                thumbnail is not cached yet.
+            fallback: Called to build the response when Pillow cannot read the
+                image (e.g. SVG), typically to serve the original file. A
+                `404 Not Found` response is returned if it is None.
+        """
+        etag = hashlib.sha1(f"{key}:{self.size}".encode()).hexdigest()
+        if etag in self._failures:
+            return await self._fallback_response(fallback)
+        # The key identifies the image content, so the thumbnail never changes
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, cache_control=THUMBNAIL_CACHE_CONTROL)
+        path = os.path.join(self.directory, etag)
+        cached = await anyio.to_thread.run_sync(_lookup, path)
+        stream: Callable[[int, int], Iterator[bytes]] = partial(iter_file, path)
+        if cached is None:
+            data = await anyio.to_thread.run_sync(load)  # type: ignore
+            if self.max_workers is not None and self._limiter is None:
+                self._limiter = anyio.CapacityLimiter(self.max_workers)
+            try:
+                thumbnail = await anyio.to_process.run_sync(
+                    partial(make_thumbnail, data, self.size), limiter=self._limiter
+                )
+            except (OSError, Image.DecompressionBombError):
+                # Not an image Pillow can read, don't try again
+                self._failures.add(etag)
+                return await self._fallback_response(fallback)
+            await anyio.to_thread.run_sync(partial(self._store, path, thumbnail))
+            # Served from memory, the file may already be evicted
+            stream = partial(_iter_bytes, thumbnail)
+            cached = len(thumbnail), _media_type(thumbnail)
+        size, media_type = cached
+        return file_response(
+            request,
+            stream,
+            size=size,
+            media_type=media_type,
+            filename="thumbnail.png" if media_type == "image/png" else "thumbnail.jpg",
+            etag=etag,
+            cache_control=THUMBNAIL_CACHE_CONTROL,
+        )
+
+    async def _fallback_response(
+        self, fallback: Optional[Callable[[], Awaitable[Response]]]
+    ) -> Response:
+        if fallback is not None:
+            return await fallback()
+        return JSONResponse({"detail": "Not found"}, status_code=404)
+
+    def _store(self, path: str, thumbnail: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(thumbnail)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_size += len(thumbnail)
+            if self._total_size > self.max_size:
+                self._evict(keep=path)
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """Return the last access time, the size and the path of the cached
+        thumbnails."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        """Remove the least recently used thumbnails, except `keep`, until the
+        cache fits in `max_size`."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            if path == keep:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+        self._total_size = total
+
+
+def make_thumbnail(data: bytes, size: Tuple[int, int]) -> bytes:
+    """Return the thumbnail of an image, in JPEG format unless the image has
+    transparency, in which case PNG is used."""
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail(size)
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        output = io.BytesIO()
+        if has_alpha:
+            image.save(output, format="PNG", optimize=True)
+        else:
+            image.convert("RGB").save(output, format="JPEG", quality=85)
+        return output.getvalue()
+
+
+def _lookup(path: str) -> Optional[Tuple[int, str]]:
+    """Return the size and the content type of a cached thumbnail, marking it as
+    recently used. Return None when it is not cached."""
+    try:
+        os.utime(path)
+        with open(path, "rb") as f:
+            header = f.read(len(_PNG_SIGNATURE))
+        return os.path.getsize(path), _media_type(header)
+    except FileNotFoundError:
+        return None
+
+
+def _iter_bytes(data: bytes, start: int, end: int) -> Iterator[bytes]:
+    yield data[start : end + 1]
+
+
+def _media_type(data: bytes) -> str:
+    return "image/png" if data.startswith(_PNG_SIGNATURE) else "image/jpeg"
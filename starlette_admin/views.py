@@ -1,24 +1,39 @@
+import hashlib
 import inspect
+import uuid
 from abc import abstractmethod
+from contextlib import asynccontextmanager
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
 )
+from urllib.parse import quote
 
+import anyio
 from jinja2 import Template
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.templating import Jinja2Templates
-from starlette_admin._types import ExportType, RequestAction
+from starlette_admin._types import (
+    UNSET,
+    CountStrategy,
+    ExportFormat,
+    ExportType,
+    RequestAction,
+    Unset,
+)
 from starlette_admin.actions import action
+from starlette_admin.cache import BaseCache
 from starlette_admin.exceptions import ActionFailed
 from starlette_admin.fields import (
     BaseField,
@@ -27,10 +42,12 @@ from starlette_admin.fields import (
     HasOne,
     RelationField,
 )
-from starlette_admin.helpers import extract_fields
+from starlette_admin.helpers import decode_cursor, encode_cursor, extract_fields
 from starlette_admin.i18n import get_locale, ngettext
 from starlette_admin.i18n import lazy_gettext as _
 
+_PK_PLACEHOLDER = "__starlette_admin_pk__"
+
 
 class BaseView:
     """
@@ -184,6 +201,11 @@ class BaseModelView(BaseView):
         searchable_fields: List of searchable fields.
         sortable_fields: List of sortable fields.
         export_fields: List of fields to include in exports.
+        server_export_formats: A list of formats available for server-side exports,
+            which stream all the items matching the current search and order. Available
+            formats are `['csv', 'ndjson']`. Disabled by default.
+        export_chunk_size: Number of items fetched at once during server-side exports.
+            Default value is set to `1000`.
         fields_default_sort: Initial order (sort) to apply to the table.
             eg: `["title", ("price", True)]`.
         export_types: A list of available export filetypes. Available
@@ -200,6 +222,38 @@ class BaseModelView(BaseView):
             Default value is set to `[10, 25, 50, 100]`. Use `-1`to display All
         responsive_table: Enable/Disable [responsive](https://datatables.net/extensions/responsive/)
             extension
+        keyset_pagination: Enable cursor (keyset) pagination in List page. When enabled,
+            the API returns a `next_cursor` built from the sort key and the primary key of
+            the last item, which is used to fetch the next page with a seek predicate
+            instead of an offset. Full text search still uses offset pagination.
+        count_strategy: How the total number of items is computed for the List page,
+            see [CountStrategy][starlette_admin._types.CountStrategy].
+            Default value is `CountStrategy.EXACT`.
+        count_cap: Maximum number of items counted when `count_strategy` is
+            `CountStrategy.CAPPED`. Default value is set to `10000`.
+        concurrent_count: Run the List page query and the count query concurrently,
+            see [concurrent_request][starlette_admin.views.BaseModelView.concurrent_request].
+        always_loaded_fields: Fields always loaded from the database. The List and
+            Detail pages only load the fields they display (plus the primary key),
+            list here the fields the object representation (`__admin_repr__`) depends
+            on. When it is `None` and the object representation is customized, all
+            the fields are loaded.
+        api_etag: Add a weak `ETag` to the API responses used by the List page, and
+            answer `304 Not Modified` when it matches the `If-None-Match` header. The
+            ETag is the hash of [get_api_version][starlette_admin.views.BaseModelView.get_api_version],
+            or of the response payload when it returns `None`.
+        api_cache_max_age: If set, the API responses are cached by the browser for
+            this number of seconds (`Cache-Control: private, max-age=...`).
+        cache: If set, the List page API responses are stored in this
+            [cache][starlette_admin.cache.BaseCache], keyed by the request URL, the
+            locale and the [cache scope][starlette_admin.views.BaseModelView.get_cache_scope],
+            which is only known by default when the authentication provider
+            implements `get_admin_user`.
+            Repeated queries are then answered without querying the database. The
+            entries are invalidated when items are created, edited or deleted, or
+            when an action is run from the admin interface.
+        cache_ttl: Lifetime of the cached API responses in seconds.
+            Default value is set to `60`.
         list_template: List view template. Default is `list.html`.
         detail_template: Details view template. Default is `details.html`.
         create_template: Edit view template. Default is `edit.html`.
@@ -226,11 +280,22 @@ class BaseModelView(BaseView):
         ExportType.PRINT,
     ]
     export_fields: Optional[Sequence[str]] = None
+    server_export_formats: Sequence[ExportFormat] = []
+    export_chunk_size: int = 1000
     column_visibility: bool = True
     search_builder: bool = True
     page_size: int = 10
     page_size_options: Sequence[int] = [10, 25, 50, 100]
     responsive_table: bool = False
+    keyset_pagination: bool = False
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    count_cap: int = 10000
+    concurrent_count: bool = False
+    always_loaded_fields: Optional[Sequence[str]] = None
+    api_etag: bool = False
+    api_cache_max_age: Optional[int] = None
+    cache: Optional[BaseCache] = None
+    cache_ttl: Optional[float] = 60
     list_template: str = "list.html"
     detail_template: str = "detail.html"
     create_template: str = "create.html"
@@ -396,6 +461,228 @@ class BaseModelView(BaseView):
         """
         raise NotImplementedError()
 
+    async def estimated_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+    ) -> int:
+        """
+        Return an approximate number of items, used when `count_strategy` is
+        `CountStrategy.ESTIMATED`. Backends override this to read database
+        statistics, the default implementation returns the exact count.
+        Parameters:
+            request: The request being processed
+            where: Same as in [count][starlette_admin.views.BaseModelView.count]
+        """
+        return await self.count(request, where)
+
+    async def capped_count(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+        cap: int = 10000,
+    ) -> int:
+        """
+        Count items, stopping at `cap + 1`. Used when `count_strategy` is
+        `CountStrategy.CAPPED`. A result greater than `cap` means that there are
+        more than `cap` items.
+        Parameters:
+            request: The request being processed
+            where: Same as in [count][starlette_admin.views.BaseModelView.count]
+            cap: Maximum number of items to count
+        """
+        return min(await self.count(request, where), cap + 1)
+
+    async def get_total(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+    ) -> Optional[int]:
+        """
+        Return the total number of items displayed in the List page, according
+        to `count_strategy`. Returns None when counting is disabled.
+        """
+        if self.count_strategy == CountStrategy.NONE:
+            return None
+        if self.count_strategy == CountStrategy.ESTIMATED:
+            return await self.estimated_count(request, where)
+        if self.count_strategy == CountStrategy.CAPPED:
+            return await self.capped_count(request, where, self.count_cap)
+        return await self.count(request, where)
+
+    async def find_all_with_total(
+        self,
+        request: Request,
+        skip: int = 0,
+        limit: int = 100,
+        where: Union[Dict[str, Any], str, None] = None,
+        order_by: Optional[List[str]] = None,
+        total_where: Union[Dict[str, Any], str, None, Unset] = UNSET,
+    ) -> Tuple[Sequence[Any], Optional[int]]:
+        """
+        Return a page of items and the total number of items displayed in the
+        List page. When `concurrent_count` is enabled, both queries run concurrently,
+        the total being computed with the request returned by
+        [concurrent_request][starlette_admin.views.BaseModelView.concurrent_request].
+        Parameters:
+            request: The request being processed
+            skip: Same as in [find_all][starlette_admin.views.BaseModelView.find_all]
+            limit: Same as in [find_all][starlette_admin.views.BaseModelView.find_all]
+            where: Filter applied to the page query
+            order_by: Same as in [find_all][starlette_admin.views.BaseModelView.find_all]
+            total_where: Filter applied to the count query, default to `where`. It
+                differs from `where` when keyset pagination is used.
+        """
+        count_where = where if isinstance(total_where, Unset) else total_where
+        if not self.concurrent_count or self.count_strategy == CountStrategy.NONE:
+            items = await self.find_all(
+                request=request, skip=skip, limit=limit, where=where, order_by=order_by
+            )
+            return items, await self.get_total(request, count_where)
+        results: Dict[str, Any] = {}
+
+        async def _find_all(page_request: Request) -> None:
+            results["items"] = await self.find_all(
+                request=page_request,
+                skip=skip,
+                limit=limit,
+                where=where,
+                order_by=order_by,
+            )
+
+        async def _get_total(total_request: Request) -> None:
+            results["total"] = await self.get_total(total_request, count_where)
+
+        async with self.concurrent_request(request) as total_request:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(_find_all, request)
+                tg.start_soon(_get_total, total_request)
+        return results["items"], results["total"]
+
+    async def iter_all(
+        self,
+        request: Request,
+        where: Union[Dict[str, Any], str, None] = None,
+        order_by: Optional[List[str]] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Iterate over all items, chunk by chunk. Used by server-side exports.
+        The default implementation calls
+        [find_all][starlette_admin.views.BaseModelView.find_all] for each chunk,
+        backends override it to read from a server-side cursor.
+        Parameters:
+            request: The request being processed
+            where: Same as in [find_all][starlette_admin.views.BaseModelView.find_all]
+            order_by: Same as in [find_all][starlette_admin.views.BaseModelView.find_all]
+            chunk_size: Maximum number of items in each chunk
+        """
+        # Make sure the order is total, so that chunks don't overlap
+        order_by = self.get_keyset_order_by(order_by or [])
+        skip = 0
+        while True:
+            items = await self.find_all(
+                request=request,
+                skip=skip,
+                limit=chunk_size,
+                where=where,
+                order_by=order_by,
+            )
+            if len(items) > 0:
+                yield items
+            if len(items) < chunk_size:
+                break
+            skip += chunk_size
+
+    @asynccontextmanager
+    async def concurrent_request(self, request: Request) -> AsyncIterator[Request]:
+        """
+        Yield a request to use for a query running concurrently with another query
+        on `request`, or outliving it like server-side exports which are streamed
+        after the request session is closed. It is a copy of `request` whose
+        `state.session` is the session yielded by
+        [concurrent_session][starlette_admin.views.BaseModelView.concurrent_session],
+        or `request` itself when there is none.
+        """
+        async with self.concurrent_session(request) as session:
+            if session is None:
+                yield request
+            else:
+                concurrent_request = Request(
+                    {**request.scope, "state": dict(request.scope.get("state", {}))},
+                    request.receive,
+                )
+                concurrent_request.state.session = session
+                yield concurrent_request
+
+    @asynccontextmanager
+    async def concurrent_session(self, request: Request) -> AsyncIterator[Any]:
+        """
+        Yield a new session, usable alongside the session of `request`, for
+        [concurrent_request][starlette_admin.views.BaseModelView.concurrent_request].
+        Backends whose session can't run several queries at the same time
+        override this. The default implementation yields `None`: the session of
+        `request` is used.
+        """
+        yield None
+
+    async def get_api_version(self, request: Request) -> Optional[str]:
+        """
+        Return a cheap version of the data returned by the API for `request`,
+        which changes whenever this data changes, e.g. the latest `updated_at`
+        and the number of items. It is used to answer `304 Not Modified` before
+        querying the items when `api_etag` is enabled. The default implementation
+        returns `None`, the ETag is then computed from the response payload.
+
+        !!! Example
+            ```python
+            async def get_api_version(self, request: Request) -> Optional[str]:
+                session: Session = request.state.session
+                updated_at, count = session.execute(
+                    select(func.max(Post.updated_at), func.count()).select_from(Post)
+                ).one()
+                return f"{updated_at}:{count}"
+            ```
+        """
+        return None
+
+    async def get_cache_scope(self, request: Request) -> Optional[str]:
+        """
+        Return the access scope of the current user: cached API responses are
+        only shared between requests having the same scope, and are not cached
+        when it is None. The default implementation returns the username of the
+        [admin user][starlette_admin.auth.AuthProvider.get_admin_user], and None
+        when it is unknown (no authentication provider, or `get_admin_user` not
+        implemented). Override it to share the responses between the users seeing
+        the same items, e.g. by returning the user role, or a constant when all
+        the users see the same items.
+        """
+        provider = getattr(request.app.state, "AUTH_PROVIDER", None)
+        user = provider.get_admin_user(request) if provider is not None else None
+        return None if user is None else f"user:{user.username}"
+
+    async def get_cache_key(self, request: Request) -> Optional[str]:
+        """Return the key of the cached API response of `request`, None if it
+        must not be cached."""
+        assert self.cache is not None
+        scope = await self.get_cache_scope(request)
+        if scope is None:
+            return None
+        generation_key = f"{self.identity}:generation"
+        generation = await self.cache.get(generation_key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            await self.cache.set(generation_key, generation)
+        digest = hashlib.sha1(
+            f"{request.url}|{get_locale()}|{scope}".encode()
+        ).hexdigest()
+        return f"{self.identity}:{generation}:{digest}"
+
+    async def invalidate_cache(self) -> None:
+        """Invalidate the cached API responses of this view."""
+        if self.cache is not None:
+            await self.cache.set(f"{self.identity}:generation", uuid.uuid4().hex)
+
     @abstractmethod
     async def delete(self, request: Request, pks: List[Any]) -> Optional[int]:
         """
@@ -426,6 +713,85 @@ class BaseModelView(BaseView):
         """
         raise NotImplementedError()
 
+    def coerce_pk(self, pk: Any) -> Any:
+        """
+        Convert a primary key received in a request to the type of the primary
+        key of the items, e.g. `"01"` to `1` for an integer primary key. Used to
+        match the primary keys with the memoised items, it must also accept the
+        primary key values of the items. The default implementation returns
+        `str(pk)`.
+        """
+        return str(pk)
+
+    async def get_by_pk(self, request: Request, pk: Any) -> Any:
+        """
+        Same as [find_by_pk][starlette_admin.views.BaseModelView.find_by_pk], but
+        the items are memoised for the duration of the request: an item already
+        fetched by `get_by_pk` or `get_by_pks` is not fetched again.
+        Parameters:
+            request: The request being processed
+            pk: Primary key
+        """
+        objects = _request_objects(request)
+        key = (self.identity, self.coerce_pk(pk))
+        if key not in objects:
+            objects[key] = await self.find_by_pk(request, pk)
+        return objects[key]
+
+    async def get_by_pks(self, request: Request, pks: List[Any]) -> Sequence[Any]:
+        """
+        Same as [find_by_pks][starlette_admin.views.BaseModelView.find_by_pks], with
+        the items memoised like in [get_by_pk][starlette_admin.views.BaseModelView.get_by_pk].
+        The items are returned in the order of `pks`, duplicates removed.
+        Parameters:
+            request: The request being processed
+            pks: List of Primary key
+        """
+        assert self.pk_attr is not None
+        objects = _request_objects(request)
+        pks_by_key = {(self.identity, self.coerce_pk(pk)): pk for pk in pks}
+        missing = [pk for key, pk in pks_by_key.items() if key not in objects]
+        if len(missing) > 0:
+            found = {
+                (self.identity, self.coerce_pk(getattr(obj, self.pk_attr))): obj
+                for obj in await self.find_by_pks(request, missing)
+            }
+            for key in pks_by_key:
+                objects.setdefault(key, found.get(key))
+        return [objects[key] for key in pks_by_key if objects[key] is not None]
+
+    async def get_related_items(
+        self, request: Request, values: Sequence[Tuple[RelationField, Any]]
+    ) -> List[Any]:
+        """
+        Fetch the items referenced by the submitted values of relation fields,
+        with a single [get_by_pks][starlette_admin.views.BaseModelView.get_by_pks]
+        call per foreign model.
+        Parameters:
+            request: The request being processed
+            values: List of (relation field, primary key or list of primary keys)
+        Returns:
+            For each value, the referenced item (or None if it is not found) or
+            the list of referenced items when the field is multiple.
+        """
+        pks_by_identity: Dict[str, List[Any]] = {}
+        for field, value in values:
+            assert field.identity is not None
+            pks_by_identity.setdefault(field.identity, []).extend(
+                value if field.multiple else [value]
+            )
+        for identity, pks in pks_by_identity.items():
+            await self._find_foreign_model(identity).get_by_pks(request, pks)
+        # The items are memoised now
+        related: List[Any] = []
+        for field, value in values:
+            foreign_model = self._find_foreign_model(field.identity)  # type: ignore
+            if field.multiple:
+                related.append(await foreign_model.get_by_pks(request, value))
+            else:
+                related.append(await foreign_model.get_by_pk(request, value))
+        return related
+
     @abstractmethod
     async def create(self, request: Request, data: Dict) -> Any:
         """
@@ -496,59 +862,155 @@ class BaseModelView(BaseView):
         include_relationships: bool = True,
         include_select2: bool = False,
     ) -> Dict[str, Any]:
-        obj_serialized: Dict[str, Any] = {}
+        return (
+            await self._serialize_many(
+                [obj], request, action, include_relationships, include_select2
+            )
+        )[0]
+
+    async def serialize_many(
+        self,
+        objs: Sequence[Any],
+        request: Request,
+        action: RequestAction,
+        include_relationships: bool = True,
+        include_select2: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Serialize several items at once, field by field, instead of item by item.
+        The output is the same as calling
+        [serialize][starlette_admin.views.BaseModelView.serialize] for each item.
+
+        Parameters:
+            objs: items returned by `find_all` or `find_by_pks`
+            request: The request being processed
+            action: Specify where the data will be used
+            include_relationships: Serialize relation fields
+            include_select2: Include select2 representations
+        """
+        if type(self).serialize is not BaseModelView.serialize:
+            # Respect custom per-item serialization
+            return [
+                await self.serialize(
+                    obj, request, action, include_relationships, include_select2
+                )
+                for obj in objs
+            ]
+        return await self._serialize_many(
+            objs, request, action, include_relationships, include_select2
+        )
+
+    async def _serialize_many(
+        self,
+        objs: Sequence[Any],
+        request: Request,
+        action: RequestAction,
+        include_relationships: bool = True,
+        include_select2: bool = False,
+    ) -> List[Dict[str, Any]]:
+        assert self.pk_attr is not None
+        objs = list(objs)
+        objs_serialized: List[Dict[str, Any]] = [{} for _ in objs]
+        custom_field_value = (
+            type(self).serialize_field_value is not BaseModelView.serialize_field_value
+        )
+        hidden_relations = self._hidden_relations(request, action)
         for field in self.fields:
-            if isinstance(field, RelationField) and include_relationships:
-                value = getattr(obj, field.name, None)
+            if isinstance(field, RelationField):
+                if not include_relationships or field.name in hidden_relations:
+                    continue
+                values = [getattr(obj, field.name, None) for obj in objs]
                 foreign_model = self._find_foreign_model(field.identity)  # type: ignore
-                assert foreign_model.pk_attr is not None
-                if value is None:
-                    obj_serialized[field.name] = None
-                elif isinstance(field, HasOne):
-                    if action == RequestAction.EDIT:
-                        obj_serialized[field.name] = getattr(
-                            value, foreign_model.pk_attr
-                        )
-                    else:
-                        obj_serialized[field.name] = await foreign_model.serialize(
-                            value, request, action, include_relationships=False
-                        )
+                serialized = await self._serialize_relation_values(
+                    foreign_model, field, values, request, action
+                )
+            else:
+                if type(field).parse_obj is BaseField.parse_obj:
+                    values = [getattr(obj, field.name, None) for obj in objs]
+                else:
+                    values = [await field.parse_obj(request, obj) for obj in objs]
+                if custom_field_value:
+                    serialized = [
+                        await self.serialize_field_value(value, field, action, request)
+                        for value in values
+                    ]
                 else:
-                    if action == RequestAction.EDIT:
-                        obj_serialized[field.name] = [
-                            getattr(v, foreign_model.pk_attr) for v in value
-                        ]
-                    else:
-                        obj_serialized[field.name] = [
-                            await foreign_model.serialize(
-                                v, request, action, include_relationships=False
-                            )
-                            for v in value
-                        ]
-            elif not isinstance(field, RelationField):
-                value = await field.parse_obj(request, obj)
-                obj_serialized[field.name] = await self.serialize_field_value(
-                    value, field, action, request
+                    serialized = await field.serialize_values(request, values, action)
+            for obj_serialized, value in zip(objs_serialized, serialized):
+                obj_serialized[field.name] = value
+        detail_url = self._pk_url_builder(request, "detail")
+        edit_url = self._pk_url_builder(request, "edit")
+        for obj, obj_serialized in zip(objs, objs_serialized):
+            if include_select2:
+                obj_serialized["_select2_selection"] = await self.select2_selection(
+                    obj, request
                 )
-        if include_select2:
-            obj_serialized["_select2_selection"] = await self.select2_selection(
-                obj, request
+                obj_serialized["_select2_result"] = await self.select2_result(
+                    obj, request
+                )
+            obj_serialized["_repr"] = await self.repr(obj, request)
+            pk = getattr(obj, self.pk_attr)
+            obj_serialized[self.pk_attr] = obj_serialized.get(
+                self.pk_attr, str(pk)  # Make sure the primary key is always available
+            )
+            obj_serialized["_detail_url"] = detail_url(pk)
+            obj_serialized["_edit_url"] = edit_url(pk)
+        return objs_serialized
+
+    def _pk_url_builder(self, request: Request, route: str) -> Callable[[Any], str]:
+        """Return a function building the url of `route` for a given primary key.
+        The router is resolved only once, with a placeholder in place of the
+        primary key which is then filled in with its escaped value."""
+        prefix, suffix = str(
+            request.url_for(
+                f"{request.app.state.ROUTE_NAME}:{route}",
+                identity=self.identity,
+                pk=_PK_PLACEHOLDER,
+            )
+        ).rsplit(_PK_PLACEHOLDER, 1)
+        return lambda pk: prefix + quote(str(pk), safe="") + suffix
+
+    async def _serialize_relation_values(
+        self,
+        foreign_model: "BaseModelView",
+        field: RelationField,
+        values: List[Any],
+        request: Request,
+        action: RequestAction,
+    ) -> List[Any]:
+        """Serialize the values of a relation field for several items, all the
+        related items being serialized with a single `serialize_many` call."""
+        assert foreign_model.pk_attr is not None
+        if action == RequestAction.EDIT:
+            if isinstance(field, HasOne):
+                return [
+                    None if value is None else getattr(value, foreign_model.pk_attr)
+                    for value in values
+                ]
+            return [
+                None
+                if value is None
+                else [getattr(v, foreign_model.pk_attr) for v in value]
+                for value in values
+            ]
+        if isinstance(field, HasOne):
+            related = [value for value in values if value is not None]
+        else:
+            values = [None if value is None else list(value) for value in values]
+            related = [v for value in values if value is not None for v in value]
+        related_serialized = iter(
+            await foreign_model.serialize_many(
+                related, request, action, include_relationships=False
             )
-            obj_serialized["_select2_result"] = await self.select2_result(obj, request)
-        obj_serialized["_repr"] = await self.repr(obj, request)
-        assert self.pk_attr is not None
-        pk = getattr(obj, self.pk_attr)
-        obj_serialized[self.pk_attr] = obj_serialized.get(
-            self.pk_attr, str(pk)  # Make sure the primary key is always available
-        )
-        route_name = request.app.state.ROUTE_NAME
-        obj_serialized["_detail_url"] = str(
-            request.url_for(route_name + ":detail", identity=self.identity, pk=pk)
-        )
-        obj_serialized["_edit_url"] = str(
-            request.url_for(route_name + ":edit", identity=self.identity, pk=pk)
         )
-        return obj_serialized
+        if isinstance(field, HasOne):
+            return [
+                None if value is None else next(related_serialized) for value in values
+            ]
+        return [
+            None if value is None else [next(related_serialized) for _ in value]
+            for value in values
+        ]
 
     async def repr(self, obj: Any, request: Request) -> str:
         """Return a string representation of the given object that can be displayed in the admin interface.
@@ -662,12 +1124,98 @@ class BaseModelView(BaseView):
         """
         return await self.select2_result(obj, request)
 
+    def get_keyset_order_by(self, order_by: List[str]) -> List[str]:
+        """Return order clauses with the primary key appended as tiebreaker,
+        so that rows are totally ordered for keyset pagination."""
+        keys = [clause.strip().split(maxsplit=1)[0] for clause in order_by]
+        if self.pk_attr in keys:
+            return order_by
+        return [*order_by, f"{self.pk_attr} asc"]
+
+    def get_next_cursor(self, obj: Any, order_by: List[str]) -> Optional[str]:
+        """Return the cursor pointing after `obj` for the given order clauses,
+        or None if one of the sort values is not usable in a seek predicate."""
+        try:
+            values = [
+                getattr(obj, clause.strip().split(maxsplit=1)[0]) for clause in order_by
+            ]
+            return encode_cursor(order_by, values)
+        except (AttributeError, TypeError):
+            return None
+
+    def sorts_nulls_first(self, request: Request) -> bool:
+        """Return whether NULL values come before any other value in ascending
+        order, and after them in descending order, in the database queried for
+        the request. Used to build the keyset pagination seek predicate."""
+        return True
+
+    def build_keyset_query(
+        self,
+        request: Request,
+        cursor: str,
+        order_by: List[str],
+        where: Union[Dict[str, Any], str, None] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Convert a cursor into a seek predicate, ie. `(sort_col, pk) > (...)`,
+        expressed in the same dict format used by the search builder and combined
+        with `where`. Rows with NULL sort values are placed according to
+        [sorts_nulls_first][starlette_admin.views.BaseModelView.sorts_nulls_first].
+
+        Returns None if the cursor is invalid, was built for other order clauses
+        or if `where` is a full text search term.
+        """
+        decoded = decode_cursor(cursor)
+        if decoded is None or decoded[0] != order_by or isinstance(where, str):
+            return None
+        values = decoded[1]
+        nulls_first = self.sorts_nulls_first(request)
+        clauses = []
+        for idx, clause in enumerate(order_by):
+            key, order = clause.strip().split(maxsplit=1)
+            conditions: List[Dict[str, Any]] = [
+                {
+                    prev.strip().split(maxsplit=1)[0]: (
+                        {"is_null": None} if value is None else {"eq": value}
+                    )
+                }
+                for prev, value in zip(order_by[:idx], values[:idx])
+            ]
+            desc = order.lower() == "desc"
+            nulls_last = desc == nulls_first
+            if values[idx] is None:
+                if nulls_last:
+                    continue  # Only NULL values, equal to this one, are sorted last
+                conditions.append({key: {"is_not_null": None}})
+            else:
+                after: Dict[str, Any] = {key: {"lt" if desc else "gt": values[idx]}}
+                if nulls_last:
+                    after = {"or": [after, {key: {"is_null": None}}]}
+                conditions.append(after)
+            clauses.append({"and": conditions})
+        seek = {"or": clauses}
+        if where is None:
+            return seek
+        return {"and": [where, seek]}
+
     def _length_menu(self) -> Any:
         return [
             self.page_size_options,
             [(_("All") if i < 0 else i) for i in self.page_size_options],
         ]
 
+    def _export_columns(self) -> List[Tuple[str, str]]:
+        """Return the names and labels of the fields included in server-side
+        exports. Names of fields nested in a CollectionField are dotted."""
+        columns = []
+        fringe = list(self.fields)
+        while len(fringe) > 0:
+            field = fringe.pop(0)
+            if isinstance(field, CollectionField):
+                fringe[0:0] = field.fields
+            elif field._name in self.export_fields:  # type: ignore
+                columns.append((field._name, str(field.label)))  # type: ignore
+        return columns
+
     def _search_columns_selector(self) -> List[str]:
         return ["%s:name" % name for name in self.searchable_fields]  # type: ignore
 
@@ -689,6 +1237,58 @@ class BaseModelView(BaseView):
         """
         return extract_fields(self.fields, action)
 
+    def _action_fields(
+        self, request: Request, action: RequestAction
+    ) -> Sequence[BaseField]:
+        """Return the fields used by `action` for the request: the fields listed
+        in `export_fields` when items are listed for a server-side export
+        (`request.state.exporting`), the displayed fields otherwise."""
+        if action == RequestAction.LIST and getattr(request.state, "exporting", False):
+            exported = {name.split(".", 1)[0] for name in self.export_fields or []}
+            return [field for field in self.fields if field.name in exported]
+        return self.get_fields_list(request, action)
+
+    def _hidden_relations(
+        self, request: Request, action: Optional[RequestAction]
+    ) -> Set[str]:
+        """Return the names of the relation fields not used by `action` when it
+        is the action the request is processed for (see `request.state.action`).
+        These relationships don't need to be loaded nor serialized."""
+        if action not in (
+            RequestAction.LIST,
+            RequestAction.DETAIL,
+            RequestAction.EDIT,
+        ) or action != getattr(request.state, "action", None):
+            return set()
+        displayed = {field.name for field in self._action_fields(request, action)}
+        return {
+            field.name
+            for field in self.fields
+            if isinstance(field, RelationField) and field.name not in displayed
+        }
+
+    def _projected_fields(
+        self, request: Request, model: Type[Any]
+    ) -> Optional[Set[str]]:
+        """Return the names of the fields of `model` to load for the action the
+        request is processed for, or `None` when all the fields should be loaded."""
+        action = getattr(request.state, "action", None)
+        if action not in (RequestAction.LIST, RequestAction.DETAIL):
+            return None
+        if self.always_loaded_fields is None and (
+            hasattr(model, "__admin_repr__")
+            or type(self).repr is not BaseModelView.repr
+        ):
+            return None  # The representation can depend on any field
+        fields = self._action_fields(request, action)
+        if any(type(field).parse_obj is not BaseField.parse_obj for field in fields):
+            return None
+        names = {field.name for field in fields}
+        names.update(self.always_loaded_fields or [])
+        assert self.pk_attr is not None
+        names.add(self.pk_attr)
+        return names
+
     def _additional_css_links(
         self, request: Request, action: RequestAction
     ) -> Sequence[str]:
@@ -736,6 +1336,9 @@ class BaseModelView(BaseView):
             "columnVisibility": self.column_visibility,
             "searchBuilder": self.search_builder,
             "responsiveTable": self.responsive_table,
+            "keysetPagination": self.keyset_pagination,
+            "countStrategy": self.count_strategy,
+            "countCap": self.count_cap,
             "fields": [f.dict() for f in self.get_fields_list(request)],
             "actions": await self.get_all_actions(request),
             "pk": self.pk_attr,
@@ -746,7 +1349,20 @@ class BaseModelView(BaseView):
             "actionUrl": request.url_for(
                 f"{request.app.state.ROUTE_NAME}:action", identity=self.identity
             ),
+            "exportUrl": request.url_for(
+                f"{request.app.state.ROUTE_NAME}:export", identity=self.identity
+            ),
+            "serverExportFormats": self.server_export_formats,
             "dt_i18n_url": request.url_for(
                 f"{request.app.state.ROUTE_NAME}:statics", path=f"i18n/dt/{locale}.json"
             ),
         }
+
+
+def _request_objects(request: Request) -> Dict[Tuple[Optional[str], Any], Any]:
+    """Return the items fetched during the request, by (identity, pk)."""
+    try:
+        return request.state.objects
+    except AttributeError:
+        request.state.objects = {}
+        return request.state.objects
@@ -9,6 +9,7 @@ import pytest
 from mongoengine import connect, disconnect
 from starlette.applications import Starlette
 from starlette.testclient import TestClient
+from starlette_admin import ExportFormat
 from starlette_admin.contrib.mongoengine import Admin, ModelView
 
 from tests.mongoengine import MONGO_URL
@@ -112,6 +113,133 @@ class TestMongoBasic:
         )
         assert {"IPhone X", "OPPOF19"} == {x["title"] for x in response.json()["items"]}
 
+    @pytest.mark.parametrize(
+        "run_in_thread, thread_limit", [(False, None), (True, None), (True, 1)]
+    )
+    def test_api_thread_options(self, run_in_thread, thread_limit):
+        class ProductView(ModelView):
+            pass
+
+        ProductView.run_in_thread = run_in_thread
+        ProductView.thread_limit = thread_limit
+        admin = Admin()
+        admin.add_view(ProductView(Product))
+        app = Starlette()
+        admin.mount_to(app)
+        client = TestClient(app, base_url="http://testserver")
+        response = client.get("/admin/api/product?limit=2&order_by=title desc")
+        data = response.json()
+        assert data["total"] == 5
+        assert ["Samsung Universe 9", "OPPOF19"] == [x["title"] for x in data["items"]]
+
+    def test_api_as_pymongo(self, client):
+        class ProductView(ModelView):
+            exclude_fields_from_list = ["manual", "image"]
+            list_as_pymongo = True
+            batch_size = 2
+
+        admin = Admin()
+        admin.add_view(ProductView(Product, identity="raw-product"))
+        app = Starlette()
+        admin.mount_to(app)
+        raw_client = TestClient(app, base_url="http://testserver")
+        params = {"limit": -1, "order_by": "title desc"}
+        expected = client.get("/admin/api/product", params=params).json()["items"]
+        response = raw_client.get("/admin/api/raw-product", params=params)
+        items = response.json()["items"]
+        assert len(items) == 5
+        for item, expected_item in zip(items, expected):
+            for key in ("id", "title", "description", "price", "brand", "created_at"):
+                assert item[key] == expected_item[key]
+
+    @pytest.mark.parametrize("list_as_pymongo", [False, True])
+    def test_api_facet_count(self, client, list_as_pymongo):
+        class ProductView(ModelView):
+            exclude_fields_from_list = ["manual", "image"]
+            facet_count = True
+
+            async def count(self, request, where=None):
+                raise AssertionError("The total must be computed with $facet")
+
+        ProductView.list_as_pymongo = list_as_pymongo
+        admin = Admin()
+        admin.add_view(ProductView(Product, identity="facet-product"))
+        app = Starlette()
+        admin.mount_to(app)
+        facet_client = TestClient(app, base_url="http://testserver")
+        for params in [
+            {"skip": 1, "limit": 2, "order_by": "title desc"},
+            {"where": '{"price": {"gt": 500}}', "order_by": "price asc"},
+            {"where": "IPhone", "limit": -1},
+            {"where": "Unknown"},
+        ]:
+            expected = client.get("/admin/api/product", params=params).json()
+            data = facet_client.get("/admin/api/facet-product", params=params).json()
+            assert data["total"] == expected["total"]
+            assert [(x["id"], x["title"], x["price"]) for x in data["items"]] == [
+                (x["id"], x["title"], x["price"]) for x in expected["items"]
+            ]
+
+    @pytest.mark.parametrize("list_as_pymongo", [False, True])
+    def test_api_export_fields_excluded_from_list(self, list_as_pymongo):
+        class ProductView(ModelView):
+            exclude_fields_from_list = ["description", "manual", "image"]
+            export_fields = ["title", "description"]
+            server_export_formats = [ExportFormat.NDJSON]
+
+        ProductView.list_as_pymongo = list_as_pymongo
+        admin = Admin()
+        admin.add_view(ProductView(Product))
+        app = Starlette()
+        admin.mount_to(app)
+        client = TestClient(app, base_url="http://testserver")
+        response = client.get(
+            "/admin/api/product/export",
+            params={"format": "ndjson", "where": "IPhone", "order_by": "title asc"},
+        )
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {
+                "title": "IPhone 9",
+                "description": "An apple mobile which is nothing like apple",
+            },
+            {
+                "title": "IPhone X",
+                "description": "SIM-Free, Apple Model A19211 6.5-inch Super Retina HD"
+                " display with OLED technology A12 Bionic chip with ...",
+            },
+        ]
+
+    @pytest.mark.parametrize("list_as_pymongo", [False, True])
+    def test_api_keyset_pagination(self, list_as_pymongo):
+        class ProductView(ModelView):
+            exclude_fields_from_list = ["manual", "image"]
+            keyset_pagination = True
+
+        ProductView.list_as_pymongo = list_as_pymongo
+        Product.objects(title="OPPOF19").update(unset__description=True)
+        admin = Admin()
+        admin.add_view(ProductView(Product))
+        app = Starlette()
+        admin.mount_to(app)
+        client = TestClient(app, base_url="http://testserver")
+        for order_by in ["title desc", "description asc", "description desc"]:
+            params = {"limit": -1, "order_by": order_by}
+            expected = [
+                x["title"]
+                for x in client.get("/admin/api/product", params=params).json()["items"]
+            ]
+            titles = []
+            params = {"limit": 2, "order_by": order_by}
+            while True:
+                data = client.get("/admin/api/product", params=params).json()
+                assert data["total"] == 5
+                titles.extend(x["title"] for x in data["items"])
+                if data["next_cursor"] is None:
+                    break
+                params = {**params, "skip": 999, "cursor": data["next_cursor"]}
+            assert titles == expected
+            assert len(titles) == 5
+
     def test_api_fulltext(self, client):
         response = client.get(
             "/admin/api/product?limit=-1&where=IPhone&order_by=price asc"
@@ -366,3 +494,61 @@ class TestMongoBasic:
         assert User.objects.count() == 1
         user = User.objects(name="John").get()
         assert user.store.name == "Jewelry store"
+
+    def test_reference_prefetching(self, client, monkeypatch):
+        products = list(Product.objects.order_by("title"))
+        stores = [
+            Store(name=f"Store {i}", products=products[i : i + 2]).save()
+            for i in range(4)
+        ]
+        for i in range(4):
+            User(name=f"User {i}", store=stores[i]).save()
+        queries = []
+        collection_class = type(Product._get_collection())
+        find = collection_class.find
+
+        def counting_find(collection, *args, **kwargs):
+            queries.append(collection.name)
+            return find(collection, *args, **kwargs)
+
+        monkeypatch.setattr(collection_class, "find", counting_find)
+        response = client.get("/admin/api/store", params={"order_by": "name asc"})
+        items = response.json()["items"]
+        assert [[p["title"] for p in x["products"]] for x in items] == [
+            [p.title for p in products[i : i + 2]] for i in range(4)
+        ]
+        assert queries.count("product") == 1
+        queries.clear()
+        response = client.get("/admin/api/user", params={"order_by": "name asc"})
+        items = response.json()["items"]
+        assert [x["store"]["name"] for x in items] == [f"Store {i}" for i in range(4)]
+        assert queries.count("store") == 1
+        queries.clear()
+        # Relations are not serialized for select2, references are not fetched
+        response = client.get(
+            "/admin/api/user", params={"order_by": "name asc", "select2": True}
+        )
+        assert len(response.json()["items"]) == 4
+        assert queries.count("store") == 0
+
+    def test_file_serving(self, client):
+        content = bytes(range(256)) * 1024
+        product = Product.objects(title="IPhone 9").get()
+        product.manual.put(
+            content, filename="manual.pdf", content_type="application/pdf"
+        )
+        product.save()
+        url = f"/admin/api/file/default/fs/{product.manual.grid_id}"
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.content == content
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-length"] == str(len(content))
+        assert response.headers["etag"] == f'"{product.manual.grid_id}"'
+        assert "last-modified" in response.headers
+        response = client.get(url, headers={"Range": "bytes=261000-262143"})
+        assert response.status_code == 206
+        assert response.content == content[261000:]
+        assert response.headers["content-range"] == "bytes 261000-262143/262144"
+        response = client.get(url, headers={"If-None-Match": response.headers["etag"]})
+        assert response.status_code == 304
@@ -84,6 +84,55 @@ async def test_api(client: AsyncClient):
     }
 
 
+async def test_api_keyset_pagination(prepare_database, aio_engine: AIOEngine):
+    class UserView(ModelView):
+        keyset_pagination = True
+
+    await aio_engine.save(
+        User(
+            name="Miles Cummerata",
+            address=Address(city="San Antonio", state="TX"),
+            hobbies=[],
+        )
+    )
+    admin = Admin(aio_engine)
+    app = Starlette()
+    admin.add_view(UserView(User))
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        for order_by, expected in [
+            (
+                "name desc",
+                [
+                    "Terry Medhurst",
+                    "Sheldon Cole",
+                    "Miles Cummerata",
+                    "Hills Terrill",
+                ],
+            ),
+            (
+                "birthday asc",
+                [
+                    "Miles Cummerata",
+                    "Terry Medhurst",
+                    "Hills Terrill",
+                    "Sheldon Cole",
+                ],
+            ),
+        ]:
+            names = []
+            params = {"limit": 2, "order_by": order_by}
+            while True:
+                response = await client.get("/admin/api/user", params=params)
+                data = response.json()
+                assert data["total"] == 4
+                names.extend(x["name"] for x in data["items"])
+                if data["next_cursor"] is None:
+                    break
+                params = {**params, "skip": 999, "cursor": data["next_cursor"]}
+            assert names == expected
+
+
 async def test_full_text_search(client: AsyncClient):
     response = await client.get("/admin/api/user?where=Terr&order_by=name asc")
     assert response.status_code == 200
@@ -85,6 +85,35 @@ async def test_deep_search(client: AsyncClient, sync_engine: SyncEngine):
     assert data["items"][1]["name"] == "Jim Rohn"
 
 
+async def test_api_facet_count(prepare_database, sync_engine: SyncEngine):
+    class FacetView(ModelView):
+        facet_count = True
+
+        async def count(self, request, where=None):
+            raise AssertionError("The total must be computed with $facet")
+
+    admin = Admin(sync_engine)
+    app = Starlette()
+    admin.add_view(FacetView(Author))
+    admin.add_view(FacetView(Quote))
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get(
+            "/admin/api/author?skip=1&limit=2&order_by=name desc"
+        )
+        data = response.json()
+        assert data["total"] == 3
+        assert ["Jim Rohn", "Albert Einstein"] == [x["name"] for x in data["items"]]
+        response = await client.get(
+            "/admin/api/quote", params={"where": "Strive", "limit": -1}
+        )
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["author"]["name"] == "Albert Einstein"
+        response = await client.get("/admin/api/quote", params={"where": "Unknown"})
+        assert response.json() == {"items": [], "total": 0}
+
+
 async def test_detail(client: AsyncClient, sync_engine: SyncEngine):
     quote = sync_engine.find_one(Quote)
     response = await client.get(f"/admin/quote/detail/{quote.id}")
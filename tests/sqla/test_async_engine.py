@@ -1,10 +1,11 @@
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
-from sqlalchemy import Column, Integer, String, select
+from sqlalchemy import Column, Integer, String, event, select
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import declarative_base
 from starlette.applications import Starlette
+from starlette_admin import ExportFormat
 from starlette_admin.contrib.sqla import Admin, ModelView
 
 from tests.sqla.utils import get_async_test_engine
@@ -94,3 +95,78 @@ async def test_delete(client: AsyncClient, session: AsyncSession):
     stmt = select(Product).where(Product.id == 1)
     product = (await session.execute(stmt)).one_or_none()
     assert product is None
+
+
+async def test_api_concurrent_count(engine: AsyncEngine, session: AsyncSession):
+    class ProductView(ModelView):
+        concurrent_count = True
+
+    session.add_all([Product(title=f"Product {i}") for i in range(5)])
+    await session.commit()
+    admin = Admin(engine)
+    admin.add_view(ProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get(
+            "/admin/api/product",
+            params={"limit": 2, "order_by": "id asc", "where": "Product"},
+        )
+        data = response.json()
+        assert data["total"] == 5
+        assert [x["title"] for x in data["items"]] == ["Product 0", "Product 1"]
+
+
+async def test_api_export(engine: AsyncEngine, session: AsyncSession):
+    class ProductView(ModelView):
+        server_export_formats = [ExportFormat.CSV]
+        export_chunk_size = 2
+
+    session.add_all([Product(title=f"Product {i}") for i in range(5)])
+    await session.commit()
+    admin = Admin(engine)
+    admin.add_view(ProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get(
+            "/admin/api/product/export",
+            params={"format": "csv", "where": "Product", "order_by": "id desc"},
+        )
+        assert response.status_code == 200
+        assert response.text.splitlines() == [
+            "Id,Title",
+            *(f"{5 - i},Product {4 - i}" for i in range(5)),
+        ]
+
+
+async def test_bulk_delete(engine: AsyncEngine, session: AsyncSession):
+    class ProductView(ModelView):
+        bulk_delete_chunk_size = 2
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    session.add_all([Product(title=f"Product {i}") for i in range(6)])
+    await session.commit()
+    admin = Admin(engine)
+    admin.add_view(ProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.post(
+                "/admin/api/product/action",
+                params={"name": "delete", "pks": [1, 2, 3, 5, 6]},
+            )
+            assert response.status_code == 200
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    # The items are deleted without being loaded, by chunks of 2
+    assert not any(s.startswith("SELECT") for s in statements)
+    assert sum(s.startswith("DELETE FROM product") for s in statements) == 3
+    products = (await session.execute(select(Product))).scalars().all()
+    assert [p.title for p in products] == ["Product 3"]
@@ -1,10 +1,13 @@
 import enum
+import io
 import json
+import os
 
 import pytest
 import pytest_asyncio
 import sqlalchemy_file as sf
 from httpx import AsyncClient
+from PIL import Image
 from sqlalchemy import (
     Boolean,
     Column,
@@ -14,15 +17,21 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
     func,
     select,
+    update,
 )
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, declarative_base, relationship
 from sqlalchemy_file.storage import StorageManager
 from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette_admin import CountStrategy, ExportFormat
 from starlette_admin.contrib.sqla import Admin
 from starlette_admin.contrib.sqla.view import ModelView
+from starlette_admin.fields import HasMany, HasOne
+from starlette_admin.thumbnails import THUMBNAIL_CACHE_CONTROL, ThumbnailCache
 
 from tests.sqla.utils import get_test_container, get_test_engine
 
@@ -129,6 +138,46 @@ async def test_file_serving_api(
     path = session.execute(stmt).scalar_one().image.path
     response = await client.get(f"/admin/api/file/{path}")
     assert response.status_code == 200
+    content = response.content
+    assert response.headers["content-length"] == str(len(content))
+    assert response.headers["etag"] == f'"{path}"'
+    assert "last-modified" in response.headers
+    assert response.headers["accept-ranges"] == "bytes"
+    response = await client.get(
+        f"/admin/api/file/{path}", headers={"Range": "bytes=10-19"}
+    )
+    assert response.status_code == 206
+    assert response.content == content[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(content)}"
+    response = await client.get(
+        f"/admin/api/file/{path}", headers={"If-None-Match": f'"{path}"'}
+    )
+    assert response.status_code == 304
+
+
+async def test_thumbnail_serving(engine: Engine, session: Session, tmp_path):
+    admin = Admin(
+        engine, thumbnail_cache=ThumbnailCache(directory=str(tmp_path), size=(4, 4))
+    )
+    admin.add_view(ModelView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    path = session.execute(select(Product).where(Product.id == 1)).scalar_one()
+    path = path.image.path
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get(f"/admin/api/thumbnail/{path}")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == THUMBNAIL_CACHE_CONTROL
+        with Image.open(io.BytesIO(response.content)) as image:
+            assert max(image.size) <= 4
+        assert len(os.listdir(tmp_path)) == 1
+        etag = response.headers["etag"]
+        response = await client.get(
+            f"/admin/api/thumbnail/{path}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        response = await client.get("/admin/api/thumbnail/test/test_id")
+        assert response.status_code == 404
 
 
 async def test_api(client: AsyncClient):
@@ -147,6 +196,447 @@ async def test_api(client: AsyncClient):
     assert {"OPPOF19", "IPhone X"} == {x["title"] for x in response.json()["items"]}
 
 
+async def test_api_keyset_pagination(engine: Engine):
+    class ProductView(ModelView):
+        keyset_pagination = True
+
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(ProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        titles = []
+        params = {"limit": 2, "order_by": "title desc"}
+        while True:
+            data = (await client.get("/admin/api/product", params=params)).json()
+            assert data["total"] == 5
+            titles.extend(x["title"] for x in data["items"])
+            if data["next_cursor"] is None:
+                break
+            params = {**params, "skip": 999, "cursor": data["next_cursor"]}
+        assert titles == [
+            "Samsung Universe 9",
+            "OPPOF19",
+            "IPhone X",
+            "IPhone 9",
+            "Huawei P30",
+        ]
+        # seek predicate is combined with where
+        where = '{"price": {"lt": 1000}}'
+        response = await client.get(
+            "/admin/api/product",
+            params={"limit": 2, "order_by": "price asc", "where": where},
+        )
+        data = response.json()
+        assert [x["title"] for x in data["items"]] == ["OPPOF19", "Huawei P30"]
+        response = await client.get(
+            "/admin/api/product",
+            params={
+                "limit": 2,
+                "order_by": "price asc",
+                "where": where,
+                "cursor": data["next_cursor"],
+            },
+        )
+        data = response.json()
+        assert data["total"] == 4
+        assert [x["title"] for x in data["items"]] == ["IPhone 9", "IPhone X"]
+        # cursor built for other order clauses is ignored
+        response = await client.get(
+            "/admin/api/product",
+            params={"limit": 2, "order_by": "title asc", "cursor": data["next_cursor"]},
+        )
+        assert [x["title"] for x in response.json()["items"]] == [
+            "Huawei P30",
+            "IPhone 9",
+        ]
+        # Enum values can't be restored from a cursor, offset pagination is used
+        titles = []
+        for skip in range(0, 6, 2):
+            params = {"skip": skip, "limit": 2, "order_by": "brand asc"}
+            data = (await client.get("/admin/api/product", params=params)).json()
+            assert data["next_cursor"] is None
+            titles.extend(x["title"] for x in data["items"])
+        assert sorted(titles) == [
+            "Huawei P30",
+            "IPhone 9",
+            "IPhone X",
+            "OPPOF19",
+            "Samsung Universe 9",
+        ]
+
+
+async def test_api_count_strategy(engine: Engine):
+    class CappedProductView(ModelView):
+        count_strategy = CountStrategy.CAPPED
+        count_cap = 3
+
+    class UncountedProductView(ModelView):
+        count_strategy = CountStrategy.NONE
+
+    class EstimatedProductView(ModelView):
+        count_strategy = CountStrategy.ESTIMATED
+
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(CappedProductView(Product, identity="capped"))
+    admin.add_view(UncountedProductView(Product, identity="uncounted"))
+    admin.add_view(EstimatedProductView(Product, identity="estimated"))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get("/admin/api/capped", params={"limit": 2})
+        assert response.json()["total"] == 4
+        response = await client.get(
+            "/admin/api/capped", params={"where": '{"price": {"gt": 600}}'}
+        )
+        assert response.json()["total"] == 2
+        response = await client.get("/admin/api/uncounted", params={"limit": 2})
+        data = response.json()
+        assert data["total"] is None
+        assert len(data["items"]) == 2
+        response = await client.get("/admin/api/estimated")
+        assert response.json()["total"] >= 0
+
+
+async def test_api_concurrent_count(engine: Engine):
+    class ProductView(ModelView):
+        concurrent_count = True
+
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(ProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get(
+            "/admin/api/product", params={"limit": 2, "order_by": "title desc"}
+        )
+        data = response.json()
+        assert data["total"] == 5
+        assert ["Samsung Universe 9", "OPPOF19"] == [x["title"] for x in data["items"]]
+
+
+async def test_api_keyset_pagination_nulls(engine: Engine, session: Session):
+    class ProductView(ModelView):
+        keyset_pagination = True
+
+    session.execute(update(Product).where(Product.id.in_([2, 4])).values(title=None))
+    session.commit()
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(ProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        for order_by in ["title desc", "title asc"]:
+            response = await client.get(
+                "/admin/api/product", params={"limit": -1, "order_by": order_by}
+            )
+            expected = [x["id"] for x in response.json()["items"]]
+            ids = []
+            params = {"limit": 2, "order_by": order_by}
+            while True:
+                data = (await client.get("/admin/api/product", params=params)).json()
+                ids.extend(x["id"] for x in data["items"])
+                if data["next_cursor"] is None:
+                    break
+                params = {**params, "cursor": data["next_cursor"]}
+            assert ids == expected
+            assert len(ids) == 5
+
+
+async def test_api_export(engine: Engine):
+    class ProductView(ModelView):
+        export_fields = ["title", "price", "user"]
+        server_export_formats = [ExportFormat.CSV, ExportFormat.NDJSON]
+        export_chunk_size = 2
+
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(ProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get(
+            "/admin/api/product/export",
+            params={
+                "format": "csv",
+                "where": '{"price": {"lt": 1000}}',
+                "order_by": "price desc",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert (
+            response.headers["content-disposition"]
+            == 'attachment; filename="product.csv"'
+        )
+        assert response.text.splitlines() == [
+            "Title,Price,User",
+            "IPhone X,899.0,",
+            "IPhone 9,549.0,",
+            "Huawei P30,499.0,",
+            "OPPOF19,280.0,",
+        ]
+        response = await client.get(
+            "/admin/api/product/export",
+            params={"format": "ndjson", "where": "IPhone", "order_by": "title asc"},
+        )
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"title": "IPhone 9", "price": 549.0, "user": None},
+            {"title": "IPhone X", "price": 899.0, "user": None},
+        ]
+        response = await client.get(
+            "/admin/api/product/export", params={"format": "xlsx"}
+        )
+        assert response.status_code == 400
+
+
+async def test_api_export_fields(engine: Engine):
+    class ExportUserView(UserView):
+        export_fields = ["name", "files"]
+        server_export_formats = [ExportFormat.CSV]
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    admin = Admin(engine, json_encoder=lambda value: b"encoded")
+    admin.add_view(ExportUserView(User))
+    admin.add_view(ModelView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.get(
+                "/admin/api/user/export", params={"format": "csv"}
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    # Files are encoded with the admin JSON encoder
+    assert response.text.splitlines() == ["Name,Files", "Doe,encoded"]
+    # Products are not exported, so they are not loaded
+    assert not any("FROM product" in s for s in statements)
+
+
+async def test_api_export_fields_excluded_from_list(engine: Engine, session: Session):
+    class ExportProductView(ModelView):
+        exclude_fields_from_list = ["description", "user"]
+        export_fields = ["id", "description", "user"]
+        server_export_formats = [ExportFormat.NDJSON]
+
+    session.execute(update(Product).where(Product.id == 1).values(user_name="Doe"))
+    session.commit()
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(ExportProductView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get(
+            "/admin/api/product/export",
+            params={"format": "ndjson", "where": '{"id": {"lt": 3}}'},
+        )
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert [item["description"] for item in items] == [
+        "An apple mobile which is nothing like apple",
+        "SIM-Free, Apple Model A19211 6.5-inch Super Retina HD display with OLED"
+        " technology A12 Bionic chip with ...",
+    ]
+    assert [item["user"] and item["user"]["name"] for item in items] == ["Doe", None]
+
+
+async def test_relationship_loading(engine: Engine, session: Session):
+    class ListUserView(UserView):
+        exclude_fields_from_list = ["products"]
+
+    session.execute(update(Product).where(Product.id < 3).values(user_name="Doe"))
+    session.commit()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    admin = Admin(engine)
+    admin.add_view(ListUserView(User))
+    admin.add_view(ModelView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.get("/admin/api/user")
+            assert "products" not in response.json()["items"][0]
+            assert not any("FROM product" in s for s in statements)
+
+            statements.clear()
+            response = await client.get("/admin/api/product", params={"limit": 2})
+            assert [x["user"]["name"] for x in response.json()["items"]] == [
+                "Doe",
+                "Doe",
+            ]
+            assert len(statements) == 2  # page + count, user is joined
+
+            statements.clear()
+            response = await client.get("/admin/user/detail/Doe")
+            assert response.status_code == 200
+            # products are loaded with a separated query instead of being joined
+            assert len(statements) == 2
+            assert "JOIN" not in statements[0]
+            assert "FROM product" in statements[1]
+            assert "product.description" in statements[1]
+
+            statements.clear()
+            response = await client.get("/admin/user/edit/Doe")
+            assert response.status_code == 200
+            assert "FROM product" in statements[1]
+            # only primary keys are loaded for the edit form
+            assert "product.description" not in statements[1]
+
+            response = await client.post(
+                "/admin/user/edit/Doe",
+                data={"name": "Doe", "products": [1, 3]},
+                follow_redirects=False,
+            )
+            assert response.status_code == 303
+            stmt = select(Product.id).where(Product.user_name == "Doe")
+            assert session.execute(stmt).scalars().all() == [1, 3]
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def test_edit_fetches_items_once(engine: Engine, session: Session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(ModelView(Product))
+    app = Starlette()
+    admin.mount_to(app)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.post(
+                "/admin/product/edit/2",
+                data={
+                    "title": "Edited",
+                    "price": 1049,
+                    "brand": "Infinix",
+                    "user": "Doe",
+                },
+                follow_redirects=False,
+            )
+            assert response.status_code == 303
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    # The product is fetched once, then refreshed after the commit
+    assert sum("WHERE product.id = ?" in s for s in statements) == 2
+    assert sum("WHERE user.name IN" in s for s in statements) == 1
+    assert session.get(Product, 2).user_name == "Doe"
+
+
+async def test_find_all_with_total(session: Session):
+    view = ModelView(Product)
+    request = Request({"type": "http", "state": {"session": session}})
+    where = {"price": {"lt": 1000}}
+    items, total = await view.find_all_with_total(request, limit=2, where=where)
+    assert len(items) == 2
+    assert total == 4
+    _, total = await view.find_all_with_total(request, where=where, total_where=None)
+    assert total == 5
+
+
+async def test_get_by_pks(session: Session):
+    view = ModelView(Product)
+    request = Request({"type": "http", "state": {"session": session}})
+    products = await view.get_by_pks(request, ["3", "01", "3", 1, "42"])
+    assert [p.id for p in products] == [3, 1]
+    assert await view.get_by_pk(request, "003") is products[0]
+
+
+async def test_related_items_fetched_per_model(engine: Engine, session: Session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    product_view = ModelView(Product)
+    admin.add_view(product_view)
+    request = Request({"type": "http", "state": {"session": session}})
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        seller, buyer, products = await product_view.get_related_items(
+            request,
+            [
+                (HasOne("seller", identity="user"), "Doe"),
+                (HasOne("buyer", identity="user"), "Unknown"),
+                (HasMany("products", identity="product"), ["3", "01", "3"]),
+            ],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert sum("WHERE user.name IN (?, ?)" in s for s in statements) == 1
+    assert sum("WHERE product.id IN (?, ?)" in s for s in statements) == 1
+    assert seller.name == "Doe"
+    assert buyer is None
+    assert [p.id for p in products] == [3, 1]
+
+
+async def test_column_projection(engine: Engine):
+    class ProductView(ModelView):
+        exclude_fields_from_list = ["description", "image"]
+
+    class ReprProductView(ProductView):
+        async def repr(self, obj, request):
+            return obj.description
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    admin = Admin(engine)
+    admin.add_view(UserView(User))
+    admin.add_view(ProductView(Product))
+    admin.add_view(ReprProductView(Product, identity="repr-product"))
+    app = Starlette()
+    admin.mount_to(app)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.get(
+                "/admin/api/product", params={"order_by": "price asc"}
+            )
+            assert response.json()["items"][0]["title"] == "OPPOF19"
+            assert "description" not in statements[0].split("FROM")[0]
+            assert "image" not in statements[0].split("FROM")[0]
+            assert "price" in statements[0].split("FROM")[0]
+
+            statements.clear()
+            response = await client.get("/admin/product/detail/1")
+            assert response.status_code == 200
+            assert "description" in statements[0].split("FROM")[0]
+
+            statements.clear()
+            response = await client.get("/admin/api/repr-product")
+            assert response.status_code == 200
+            assert "description" in statements[0].split("FROM")[0]
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 async def test_api_fulltext(client: AsyncClient):
     response = await client.get(
         "/admin/api/product?limit=-1&where=IPhone&order_by=price asc"
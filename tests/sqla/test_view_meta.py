@@ -19,6 +19,7 @@ from sqlalchemy import (
     Text,
     Time,
     TypeDecorator,
+    event,
 )
 from sqlalchemy.dialects.mysql import INTEGER, YEAR
 from sqlalchemy.dialects.postgresql import BIT, INET, MACADDR, UUID
@@ -352,3 +353,39 @@ def test_unsigned_int_conversion() -> None:
             "id", required=True, exclude_from_create=True, exclude_from_edit=True, min=0
         ),
     ]
+
+
+def test_can_bulk_delete() -> None:
+    class Author(Base):
+        __tablename__ = "author"
+
+        id = Column(Integer, primary_key=True)
+        books = relationship("Book", back_populates="author", passive_deletes=True)
+
+    class Book(Base):
+        __tablename__ = "book"
+
+        id = Column(Integer, primary_key=True)
+        author_id = Column(Integer, ForeignKey("author.id", ondelete="CASCADE"))
+        author = relationship("Author", back_populates="books")
+
+    assert ModelView(Other)._can_bulk_delete()
+    assert ModelView(Author)._can_bulk_delete()
+    assert ModelView(Book)._can_bulk_delete()
+    # One-to-many relationships updated by the ORM
+    assert not ModelView(User)._can_bulk_delete()
+    assert not ModelView(Document)._can_bulk_delete()
+    # Files are removed by sqlalchemy-file when the instances are deleted
+    assert not ModelView(Attachment)._can_bulk_delete()
+
+    class AttachmentView(ModelView):
+        fields = ["id"]
+
+    assert not AttachmentView(Attachment)._can_bulk_delete()
+
+    def before_delete(mapper, connection, target):
+        pass  # pragma: no cover
+
+    event.listen(Book, "before_delete", before_delete)
+    assert not ModelView(Book)._can_bulk_delete()
+    event.remove(Book, "before_delete", before_delete)
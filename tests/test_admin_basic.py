@@ -1,3 +1,7 @@
+import os
+from unittest import mock
+
+from jinja2 import FileSystemBytecodeCache
 from starlette.applications import Starlette
 from starlette.testclient import TestClient
 from starlette_admin import BaseAdmin
@@ -64,3 +68,25 @@ class TestAdminBasic:
         assert response.status_code == 200
         assert response.text.count("<title>DashBoard</title>") == 1
         assert response.text.count("https://test.com/logo.png") == 1
+
+    def test_precompile_templates(self, tmp_path):
+        bytecode_cache = FileSystemBytecodeCache(str(tmp_path))
+        admin = BaseAdmin(
+            templates_dir="tests/templates",
+            templates_bytecode_cache=bytecode_cache,
+            precompile_templates=True,
+        )
+        app = Starlette()
+        admin.mount_to(app)
+        compiled = admin.templates.env.cache
+        assert compiled is not None
+        names = {name for _, name in compiled}
+        assert {"index.html", "list.html", "forms/enum.html", "report.html"} <= names
+        assert len(os.listdir(tmp_path)) == len(names)
+        # Another admin (i.e. another worker) loads the compiled templates
+        admin = BaseAdmin(templates_bytecode_cache=bytecode_cache)
+        admin.mount_to(Starlette())
+        with mock.patch.object(
+            admin.templates.env, "compile", side_effect=AssertionError
+        ):
+            admin.compile_templates()
@@ -13,6 +13,7 @@ from starlette_admin import (
     TinyMCEEditorField,
 )
 from starlette_admin.auth import AdminUser, AuthProvider
+from starlette_admin.cache import MemoryCache
 from starlette_admin.exceptions import FormValidationError, LoginFailed
 from starlette_admin.views import CustomView
 
@@ -305,3 +306,27 @@ class TestAccess:
             cookies={"session": "admin"},
         )
         assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_api_cache_per_user(self, report_view):
+        queries = []
+
+        class CachedPostView(PostView):
+            cache = MemoryCache()
+
+            async def find_all(self, *args, **kwargs):
+                queries.append(kwargs)
+                return await super().find_all(*args, **kwargs)
+
+        admin = BaseAdmin(auth_provider=MyAuthProvider())
+        app = Starlette()
+        admin.add_view(CachedPostView)
+        admin.mount_to(app)
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            for username in ("john", "admin", "john", "admin"):
+                response = await client.get(
+                    "/admin/api/post", cookies={"session": username}
+                )
+                assert response.status_code == 200
+        # Responses are cached per user
+        assert len(queries) == 2
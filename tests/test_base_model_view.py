@@ -1,6 +1,14 @@
+import enum
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time
+from decimal import Decimal
 from typing import List
+from uuid import UUID
 
+import pytest
+from bson import ObjectId
 from pydantic import Field
+from starlette.requests import Request
 from starlette_admin import (
     IntegerField,
     RequestAction,
@@ -8,6 +16,7 @@ from starlette_admin import (
     TagsField,
     TextAreaField,
 )
+from starlette_admin.helpers import decode_cursor, encode_cursor
 
 from tests.dummy_model_view import DummyBaseModel, DummyModelView
 
@@ -111,3 +120,114 @@ class TestView:
             "content",
             "tags",
         )
+
+    def test_keyset_query(self):
+        class PostView(DummyModelView):
+            model = Post
+            fields = (IntegerField("id"), StringField("title"))
+
+        view_instance = PostView()
+        order_by = view_instance.get_keyset_order_by(["title desc"])
+        assert order_by == ["title desc", "id asc"]
+        assert view_instance.get_keyset_order_by(["id desc"]) == ["id desc"]
+        cursor = view_instance.get_next_cursor(
+            Post(id=3, title="abc", content=""), order_by
+        )
+        assert view_instance.build_keyset_query(None, cursor, order_by) == {
+            "or": [
+                {
+                    "and": [
+                        {"or": [{"title": {"lt": "abc"}}, {"title": {"is_null": None}}]}
+                    ]
+                },
+                {"and": [{"title": {"eq": "abc"}}, {"id": {"gt": 3}}]},
+            ]
+        }
+        assert view_instance.build_keyset_query(None, cursor, order_by, {"id": 1}) == {
+            "and": [{"id": 1}, view_instance.build_keyset_query(None, cursor, order_by)]
+        }
+        assert view_instance.build_keyset_query(None, cursor, order_by, "term") is None
+        assert view_instance.build_keyset_query(None, cursor, ["id asc"]) is None
+        assert view_instance.build_keyset_query(None, "invalid", order_by) is None
+        # NULL values are sorted first in ascending order by default
+        cursor = view_instance.get_next_cursor(
+            Post.construct(id=3, title=None), order_by
+        )
+        assert view_instance.build_keyset_query(None, cursor, order_by) == {
+            "or": [{"and": [{"title": {"is_null": None}}, {"id": {"gt": 3}}]}]
+        }
+        cursor = view_instance.get_next_cursor(
+            Post(id=3, title="abc", content=""), ["title asc", "id asc"]
+        )
+        assert view_instance.build_keyset_query(
+            None, cursor, ["title asc", "id asc"]
+        ) == {
+            "or": [
+                {"and": [{"title": {"gt": "abc"}}]},
+                {"and": [{"title": {"eq": "abc"}}, {"id": {"gt": 3}}]},
+            ]
+        }
+        cursor = view_instance.get_next_cursor(
+            Post.construct(id=3, title=None), ["title asc", "id asc"]
+        )
+        assert view_instance.build_keyset_query(
+            None, cursor, ["title asc", "id asc"]
+        ) == {
+            "or": [
+                {"and": [{"title": {"is_not_null": None}}]},
+                {"and": [{"title": {"is_null": None}}, {"id": {"gt": 3}}]},
+            ]
+        }
+
+    def test_cursor_values(self):
+        values = [
+            datetime(2023, 5, 1, 10, 30),
+            date(2023, 5, 1),
+            time(10, 30),
+            Decimal("10.50"),
+            UUID("12345678123456781234567812345678"),
+            ObjectId("62fe037d39e3b3fc593094b3"),
+            1,
+            1.5,
+            "a",
+        ]
+        assert decode_cursor(encode_cursor(["a asc"], values)) == (["a asc"], values)
+
+    def test_cursor_unsupported_values(self):
+        class Status(str, enum.Enum):
+            A = "a"
+
+        class PostView(DummyModelView):
+            model = Post
+            fields = (IntegerField("id"), StringField("title"))
+
+        with pytest.raises(TypeError):
+            encode_cursor(["status asc"], [Status.A])
+        with pytest.raises(TypeError):
+            encode_cursor(["data asc"], [b"data"])
+        # Offset pagination is used instead
+        assert (
+            PostView().get_next_cursor(
+                Post.construct(id=3, title=Status.A), ["title asc", "id asc"]
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_request(self):
+        class PostView(DummyModelView):
+            model = Post
+            fields = (IntegerField("id"), StringField("title"))
+
+        class SessionPostView(PostView):
+            @asynccontextmanager
+            async def concurrent_session(self, request):
+                yield "concurrent"
+
+        request = Request({"type": "http", "state": {"session": "main"}})
+        async with PostView().concurrent_request(request) as concurrent_request:
+            assert concurrent_request is request
+        async with SessionPostView().concurrent_request(request) as concurrent_request:
+            assert concurrent_request.state.session == "concurrent"
+            assert concurrent_request.scope["type"] == "http"
+        assert request.state.session == "main"
@@ -0,0 +1,28 @@
+import pytest
+from starlette_admin.cache import MemoryCache
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_lru():
+    cache = MemoryCache(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+    await cache.set("c", 3)
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_ttl(monkeypatch):
+    now = 0
+    monkeypatch.setattr("starlette_admin.cache.monotonic", lambda: now)
+    cache = MemoryCache(ttl=10)
+    await cache.set("a", 1)
+    await cache.set("b", 2, ttl=30)
+    now = 20
+    assert await cache.get("a") is None
+    assert await cache.get("b") == 2
+    now = 30
+    assert await cache.get("b") is None
@@ -0,0 +1,74 @@
+import datetime
+import decimal
+import enum
+import json
+import uuid
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+from starlette_admin import BaseAdmin
+from starlette_admin.encoders import (
+    get_json_encoder,
+    orjson_encoder,
+    stdlib_json_encoder,
+)
+
+from tests.test_views import PostView
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+class Size(enum.IntEnum):
+    SMALL = 1
+
+
+@pytest.mark.parametrize("encoder", [stdlib_json_encoder, orjson_encoder])
+def test_encoder(encoder):
+    value = {
+        "datetime": datetime.datetime(2023, 1, 2, 3, 4, 5, 6),
+        "date": datetime.date(2023, 1, 2),
+        "time": datetime.time(3, 4, 5),
+        "decimal": decimal.Decimal("1.10"),
+        "uuid": uuid.UUID(int=1),
+        "enums": [Color.RED, Size.SMALL],
+        "text": "Café",
+        "none": None,
+        1: True,
+    }
+    assert json.loads(encoder(value)) == {
+        "datetime": "2023-01-02T03:04:05.000006",
+        "date": "2023-01-02",
+        "time": "03:04:05",
+        "decimal": "1.10",
+        "uuid": "00000000-0000-0000-0000-000000000001",
+        "enums": ["red", 1],
+        "text": "Café",
+        "none": None,
+        "1": True,
+    }
+
+
+def test_default_encoder():
+    assert get_json_encoder() is orjson_encoder
+
+
+def test_custom_encoder():
+    calls = []
+
+    def encoder(obj):
+        calls.append(obj)
+        return stdlib_json_encoder(obj)
+
+    admin = BaseAdmin(json_encoder=encoder)
+    app = Starlette()
+    admin.add_view(PostView)
+    admin.mount_to(app)
+    client = TestClient(app)
+    response = client.get("/admin/api/post")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert len(calls) == 1
+    assert response.json()["total"] == calls[0]["total"]
@@ -1,7 +1,9 @@
 import enum
+from unittest.mock import MagicMock
 
 import pytest
-from starlette_admin import EnumField
+from starlette.requests import Request
+from starlette_admin import EnumField, RequestAction
 
 
 def test_invalid_enum_field():
@@ -34,3 +36,51 @@ def test_deprecated_from_choices_method():
         assert EnumField.from_choices(
             "myenum", choices=[("cpp", "C++"), ("py", "Python")]
         ) == EnumField("myenum", choices=[("cpp", "C++"), ("py", "Python")])
+
+
+def make_request():
+    return Request({"type": "http", "method": "GET", "headers": []})
+
+
+@pytest.mark.asyncio
+async def test_labels():
+    field = EnumField("myenum", choices=[("cpp", "C++"), ("py", "Python")])
+    request = make_request()
+    assert await field.serialize_value(request, "py", RequestAction.LIST) == "Python"
+    with pytest.raises(ValueError, match="Invalid choice value: js"):
+        await field.serialize_value(request, "js", RequestAction.LIST)
+    field = EnumField("myenum", choices=[(["cpp"], "C++")])
+    assert await field.serialize_value(request, ["cpp"], RequestAction.LIST) == "C++"
+
+
+@pytest.mark.asyncio
+async def test_choices_loader_called_once_per_request():
+    loader = MagicMock(return_value=[("cpp", "C++"), ("py", "Python")])
+    field = EnumField("myenum", choices_loader=loader, multiple=True)
+    request = make_request()
+    for _ in range(3):
+        assert await field.serialize_value(
+            request, ["py", "cpp"], RequestAction.LIST
+        ) == ["Python", "C++"]
+    assert field._get_choices(request) == loader.return_value
+    assert loader.call_count == 1
+    await field.serialize_value(make_request(), ["py"], RequestAction.LIST)
+    assert loader.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_choices_loader_cache_ttl(monkeypatch):
+    now = 0
+    monkeypatch.setattr("starlette_admin.fields.monotonic", lambda: now)
+    loader = MagicMock(return_value=[("py", "Python")])
+    field = EnumField("myenum", choices_loader=loader, choices_cache_ttl=60)
+    await field.serialize_value(make_request(), "py", RequestAction.LIST)
+    now = 30
+    await field.serialize_value(make_request(), "py", RequestAction.LIST)
+    assert loader.call_count == 1
+    monkeypatch.setattr("starlette_admin.fields.get_locale", lambda: "fr")
+    await field.serialize_value(make_request(), "py", RequestAction.LIST)
+    assert loader.call_count == 2
+    now = 100
+    await field.serialize_value(make_request(), "py", RequestAction.LIST)
+    assert loader.call_count == 3
@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from starlette_admin.responses import file_response
+
+CONTENT = bytes(range(256)) * 4
+LAST_MODIFIED = datetime(2023, 5, 1, 10, 20, 30, tzinfo=timezone.utc)
+
+
+def _stream(start, end):
+    for i in range(start, end + 1, 100):
+        yield CONTENT[i : min(i + 100, end + 1)]
+
+
+def serve(request):
+    return file_response(
+        request,
+        _stream,
+        size=len(CONTENT),
+        media_type="application/octet-stream",
+        filename="data.bin",
+        etag="file-id",
+        last_modified=LAST_MODIFIED,
+    )
+
+
+@pytest.fixture
+def client():
+    return TestClient(Starlette(routes=[Route("/file", serve)]))
+
+
+def test_full_content(client):
+    response = client.get("/file")
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-length"] == str(len(CONTENT))
+    assert response.headers["etag"] == '"file-id"'
+    assert response.headers["last-modified"] == "Mon, 01 May 2023 10:20:30 GMT"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["cache-control"] == "private, max-age=86400"
+    assert response.headers["content-disposition"] == 'attachment; filename="data.bin"'
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"If-None-Match": '"file-id"'},
+        {"If-None-Match": 'W/"other", W/"file-id"'},
+        {"If-None-Match": "*"},
+        {"If-Modified-Since": "Mon, 01 May 2023 10:20:30 GMT"},
+        {"If-Modified-Since": "Tue, 02 May 2023 00:00:00 GMT"},
+    ],
+)
+def test_not_modified(client, headers):
+    response = client.get("/file", headers=headers)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"file-id"'
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"If-None-Match": '"other"'},
+        {"If-Modified-Since": "Sun, 30 Apr 2023 00:00:00 GMT"},
+        {"If-None-Match": '"other"', "If-Modified-Since": "Tue, 02 May 2023 GMT"},
+    ],
+)
+def test_modified(client, headers):
+    response = client.get("/file", headers=headers)
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+@pytest.mark.parametrize(
+    "range_header, start, end",
+    [
+        ("bytes=0-0", 0, 0),
+        ("bytes=10-250", 10, 250),
+        ("bytes=1000-", 1000, 1023),
+        ("bytes=1000-5000", 1000, 1023),
+        ("bytes=-24", 1000, 1023),
+        ("bytes=-5000", 0, 1023),
+    ],
+)
+def test_range(client, range_header, start, end):
+    response = client.get("/file", headers={"Range": range_header})
+    assert response.status_code == 206
+    assert response.content == CONTENT[start : end + 1]
+    assert response.headers["content-range"] == f"bytes {start}-{end}/1024"
+    assert response.headers["content-length"] == str(end - start + 1)
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Range": "bytes=0-10,20-30"},
+        {"Range": "items=0-10"},
+        {"Range": "bytes=10-5"},
+        {"Range": "bytes=a-b"},
+        {"Range": "bytes=0-10", "If-Range": '"other"'},
+        {"Range": "bytes=0-10", "If-Range": "Sun, 30 Apr 2023 00:00:00 GMT"},
+    ],
+)
+def test_range_ignored(client, headers):
+    response = client.get("/file", headers=headers)
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Range": "bytes=0-10", "If-Range": '"file-id"'},
+        {"Range": "bytes=0-10", "If-Range": "Mon, 01 May 2023 10:20:30 GMT"},
+    ],
+)
+def test_if_range(client, headers):
+    response = client.get("/file", headers=headers)
+    assert response.status_code == 206
+    assert response.content == CONTENT[:11]
+
+
+@pytest.mark.parametrize("range_header", ["bytes=1024-", "bytes=-0"])
+def test_range_not_satisfiable(client, range_header):
+    response = client.get("/file", headers={"Range": range_header})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */1024"
@@ -0,0 +1,106 @@
+import gzip
+import os
+import re
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+from starlette_admin import BaseAdmin
+from starlette_admin.staticfiles import (
+    IMMUTABLE_CACHE_CONTROL,
+    AdminStaticFiles,
+    StaticFilesMount,
+    compress_directory,
+)
+
+CSS = b"body { color: red; }\n" * 100
+
+
+@pytest.fixture
+def statics_dir(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "style.css").write_bytes(CSS)
+    return tmp_path
+
+
+@pytest.fixture
+def client(statics_dir):
+    statics = AdminStaticFiles(directory=str(statics_dir))
+    app = Starlette(routes=[StaticFilesMount("/statics", app=statics, name="statics")])
+    return TestClient(app)
+
+
+def test_fingerprinted_url(client, statics_dir):
+    url = client.app.url_path_for("statics", path="css/style.css")
+    assert re.fullmatch(r"/statics/css/style\.[0-9a-f]{12}\.css", url)
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content == CSS
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    # Unknown files are not fingerprinted
+    assert client.app.url_path_for("statics", path="js/x.js") == "/statics/js/x.js"
+    # Fingerprints are computed once, building URLs doesn't read the files
+    (statics_dir / "css" / "style.css").write_bytes(CSS + b"a {}")
+    assert client.app.url_path_for("statics", path="css/style.css") == url
+    statics = AdminStaticFiles(directory=str(statics_dir))
+    app = Starlette(routes=[StaticFilesMount("/statics", app=statics, name="statics")])
+    new_url = app.url_path_for("statics", path="css/style.css")
+    assert new_url != url
+    response = TestClient(app).get(url)
+    assert response.status_code == 200
+    assert "cache-control" not in response.headers
+
+
+def test_precompressed(client, statics_dir):
+    assert compress_directory(str(statics_dir)) == [
+        str(statics_dir / "css" / "style.css.gz")
+    ]
+    url = client.app.url_path_for("statics", path="css/style.css")
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.content == CSS  # Decoded by the client
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert int(response.headers["content-length"]) == len(gzip.compress(CSS, 9))
+    response = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(CSS))
+
+
+def test_precompressed_same_directory_only(tmp_path):
+    override, packaged = tmp_path / "override", tmp_path / "packaged"
+    (override / "css").mkdir(parents=True)
+    (packaged / "css").mkdir(parents=True)
+    (override / "css" / "style.css").write_bytes(b"a { color: blue; }")
+    (packaged / "css" / "style.css").write_bytes(CSS)
+    compress_directory(str(packaged))
+    statics = AdminStaticFiles(directory=str(override))
+    # Like the packaged statics, searched after `statics_dir`
+    statics.all_directories.append(str(packaged))
+    app = Starlette(routes=[StaticFilesMount("/statics", app=statics, name="statics")])
+    client = TestClient(app)
+    response = client.get("/statics/css/style.css", headers={"Accept-Encoding": "gzip"})
+    assert response.content == b"a { color: blue; }"
+    assert "content-encoding" not in response.headers
+
+
+def test_precompressed_outdated(client, statics_dir):
+    compress_directory(str(statics_dir))
+    style = statics_dir / "css" / "style.css"
+    style.write_bytes(CSS + b"a {}")
+    gz_mtime = (statics_dir / "css" / "style.css.gz").stat().st_mtime
+    os.utime(style, (gz_mtime + 10, gz_mtime + 10))
+    response = client.get("/statics/css/style.css", headers={"Accept-Encoding": "gzip"})
+    assert response.content == CSS + b"a {}"
+    assert "content-encoding" not in response.headers
+
+
+def test_admin_statics_urls():
+    app = Starlette()
+    BaseAdmin().mount_to(app)
+    response = TestClient(app).get("/admin")
+    urls = re.findall(r"/admin/statics/([^\"']+)", response.text)
+    assert urls
+    assert all(re.search(r"\.[0-9a-f]{12}\.(js|css)$", url) for url in urls), urls
@@ -0,0 +1,101 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from starlette_admin.thumbnails import ThumbnailCache, make_thumbnail
+
+
+def image_content(mode: str, color) -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, (400, 200), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.mark.parametrize(
+    "mode, color, image_format",
+    [("RGB", (255, 0, 0), "JPEG"), ("RGBA", (255, 0, 0, 128), "PNG")],
+)
+def test_make_thumbnail(mode, color, image_format):
+    with Image.open(
+        io.BytesIO(make_thumbnail(image_content(mode, color), (64, 64)))
+    ) as image:
+        assert image.format == image_format
+        assert image.size == (64, 32)
+
+
+def test_thumbnail_cache(tmp_path):
+    content = image_content("RGB", (255, 0, 0))
+    loaded = []
+    cache = ThumbnailCache(directory=str(tmp_path), size=(32, 32))
+
+    def load(key):
+        loaded.append(key)
+        return content
+
+    async def serve(request):
+        key = request.path_params["key"]
+        return await cache.response(request, key, lambda: load(key))
+
+    client = TestClient(Starlette(routes=[Route("/{key}", serve)]))
+    response = client.get("/0")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.headers["cache-control"] == "private, max-age=31536000, immutable"
+    thumbnail_size = len(response.content)
+    assert client.get("/0").content == response.content
+    assert loaded == ["0"]
+
+    # Keep room for two thumbnails, the least recently used one is evicted
+    cache.max_size = 2 * thumbnail_size
+    client.get("/1")
+    os.utime(os.path.join(str(tmp_path), response.headers["etag"].strip('"')), (0, 0))
+    client.get("/2")
+    assert len(os.listdir(tmp_path)) == 2
+    client.get("/0")
+    assert loaded == ["0", "1", "2", "0"]
+
+
+def test_thumbnail_evicted_on_store(tmp_path):
+    content = image_content("RGB", (255, 0, 0))
+    cache = ThumbnailCache(directory=str(tmp_path), size=(32, 32), max_size=10)
+
+    async def serve(request):
+        return await cache.response(request, "0", lambda: content)
+
+    response = TestClient(Starlette(routes=[Route("/", serve)])).get("/")
+    assert response.status_code == 200
+    assert len(response.content) == int(response.headers["content-length"]) > 0
+
+
+def test_thumbnail_unreadable_image(tmp_path):
+    loaded = []
+    cache = ThumbnailCache(directory=str(tmp_path))
+
+    def load():
+        loaded.append(1)
+        return b"<svg xmlns='http://www.w3.org/2000/svg'></svg>"
+
+    async def fallback():
+        return Response(b"original", media_type="image/svg+xml")
+
+    async def serve(request):
+        return await cache.response(request, "svg", load)
+
+    async def serve_with_fallback(request):
+        return await cache.response(request, "svg", load, fallback=fallback)
+
+    client = TestClient(
+        Starlette(routes=[Route("/", serve), Route("/fallback", serve_with_fallback)])
+    )
+    assert client.get("/").status_code == 404
+    assert client.get("/").status_code == 404
+    response = client.get("/fallback")
+    assert response.status_code == 200
+    assert response.content == b"original"
+    # The failure is remembered
+    assert loaded == [1]
@@ -19,6 +19,7 @@ from starlette_admin import (
     TagsField,
     TextAreaField,
 )
+from starlette_admin.cache import MemoryCache
 from starlette_admin.exceptions import FormValidationError
 from starlette_admin.views import CustomView, DropDown, Link
 
@@ -184,6 +185,111 @@ class TestViews:
         assert data["total"] == 2
         assert data["items"][0]["id"] == 5
 
+    def test_model_view_api_etag(self):
+        class CachedPostView(PostView):
+            api_etag = True
+
+        admin = BaseAdmin()
+        app = Starlette()
+        admin.add_view(CachedPostView)
+        admin.mount_to(app)
+        client = TestClient(app)
+        response = client.get("/admin/api/post?limit=2")
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert response.headers["cache-control"] == "private, no-cache"
+        response = client.get(
+            "/admin/api/post?limit=2", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        # The ETag depends on the query and on the data
+        response = client.get(
+            "/admin/api/post?limit=3", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        PostView.db[1].title = "Updated title"
+        response = client.get(
+            "/admin/api/post?limit=2", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_model_view_api_version(self):
+        version = "1"
+        queries = []
+
+        class VersionedPostView(PostView):
+            api_etag = True
+            api_cache_max_age = 10
+
+            async def get_api_version(self, request):
+                return version
+
+            async def find_all(self, *args, **kwargs):
+                queries.append(args)
+                return await super().find_all(*args, **kwargs)
+
+        admin = BaseAdmin()
+        app = Starlette()
+        admin.add_view(VersionedPostView)
+        admin.mount_to(app)
+        client = TestClient(app)
+        response = client.get("/admin/api/post")
+        assert response.headers["cache-control"] == "private, max-age=10"
+        etag = response.headers["etag"]
+        # The items are not queried when the version didn't change
+        response = client.get("/admin/api/post", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "private, max-age=10"
+        assert len(queries) == 1
+        version = "2"
+        response = client.get("/admin/api/post", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(queries) == 2
+
+    def test_model_view_api_cache(self):
+        queries = []
+
+        class CachedPostView(PostView):
+            cache = MemoryCache()
+
+            async def find_all(self, *args, **kwargs):
+                queries.append(kwargs)
+                return await super().find_all(*args, **kwargs)
+
+        class SharedCachePostView(CachedPostView):
+            def __init__(self):
+                super().__init__()
+                self.identity = "shared-post"
+
+            async def get_cache_scope(self, request):
+                return "all"
+
+        admin = BaseAdmin()
+        app = Starlette()
+        admin.add_view(CachedPostView)
+        admin.add_view(SharedCachePostView)
+        admin.mount_to(app)
+        client = TestClient(app)
+        # Without authentication provider, the users are unknown: no caching
+        client.get("/admin/api/post?limit=2&order_by=id asc")
+        client.get("/admin/api/post?limit=2&order_by=id asc")
+        assert len(queries) == 2
+        queries.clear()
+        url = "/admin/api/shared-post"
+        data = client.get(url, params={"limit": 2, "order_by": "id asc"}).json()
+        assert client.get(url, params={"limit": 2, "order_by": "id asc"}).json() == data
+        assert len(queries) == 1
+        client.get(url, params={"limit": 2, "order_by": "id desc"})
+        assert len(queries) == 2
+        # Writes invalidate the cached responses
+        client.post(f"{url}/action", params={"name": "delete", "pks": [1]})
+        data = client.get(url, params={"limit": 2, "order_by": "id asc"}).json()
+        assert [x["id"] for x in data["items"]] == [2, 3]
+        assert len(queries) == 3
+
     def test_sync_object_representation(self):
         admin = BaseAdmin()
         app = Starlette()
@@ -444,6 +550,62 @@ class TestViews:
         assert len(UserView.db) == 3
         assert UserView.db[3].posts == [PostView.db[x] for x in [2, 5]]
 
+    def test_serialize_many(self):
+        class NicknameField(StringField):
+            async def parse_obj(self, request, obj):
+                return "terry" if obj.id == 2 else None
+
+            async def serialize_value(self, request, value, action):
+                return str(value).upper()
+
+        class CustomUserView(UserView):
+            fields = [*UserView.fields, NicknameField("nickname")]
+
+            async def serialize(self, obj, request, action, *args, **kwargs):
+                serialized = await super().serialize(
+                    obj, request, action, *args, **kwargs
+                )
+                serialized["custom"] = True
+                return serialized
+
+        UserView.db[1].posts = [PostView.db[1], PostView.db[2]]
+        UserView.db[2].reviewer = UserView.db[1]
+        admin = BaseAdmin()
+        app = Starlette()
+        admin.add_view(UserView)
+        admin.add_view(PostView)
+        admin.mount_to(app)
+        client = TestClient(app)
+        items = client.get("/admin/api/user?order_by=id asc").json()["items"]
+        assert [[p["id"] for p in x["posts"]] for x in items] == [
+            [1, 2],
+            [],
+        ]
+        assert items[0]["reviewer"] is None
+        assert items[1]["reviewer"]["name"] == "John Doe"
+        assert items[1]["_detail_url"] == "http://testserver/admin/user/detail/2"
+        assert items[1]["_edit_url"] == "http://testserver/admin/user/edit/2"
+        assert list(items[1].keys()) == [
+            "id",
+            "name",
+            "posts",
+            "reviewer",
+            "_repr",
+            "_detail_url",
+            "_edit_url",
+        ]
+        admin = BaseAdmin()
+        app = Starlette()
+        admin.add_view(CustomUserView)
+        admin.add_view(PostView)
+        admin.mount_to(app)
+        client = TestClient(app)
+        items = client.get("/admin/api/user?order_by=id asc").json()["items"]
+        assert [(x["nickname"], x["custom"]) for x in items] == [
+            (None, True),
+            ("TERRY", True),
+        ]
+
     def test_add_link(self, link_to_google):
         admin = BaseAdmin()
         app = Starlette()